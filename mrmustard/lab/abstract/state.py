@@ -16,7 +16,9 @@
 
 from __future__ import annotations
 
+import string
 import warnings
+from copy import copy
 from typing import (
     TYPE_CHECKING,
     Iterable,
@@ -47,6 +49,10 @@ from mrmustard.utils.typing import (
 if TYPE_CHECKING:
     from .transformation import Transformation
 
+# formatters of ``State._format_probability`` for small and regular probabilities
+_SMALL_PROB_FMT = "{:.3e} %".format
+_PROB_FMT = "{:.3%}".format
+
 
 # pylint: disable=too-many-instance-attributes
 class State:  # pylint: disable=too-many-public-methods
@@ -62,6 +68,7 @@ class State:  # pylint: disable=too-many-public-methods
         dm: ComplexTensor = None,
         modes: Sequence[int] = None,
         cutoffs: Sequence[int] = None,
+        is_pure: Optional[bool] = None,
         _norm: float = 1.0,
     ):
         r"""Initializes the state.
@@ -79,11 +86,14 @@ class State:  # pylint: disable=too-many-public-methods
             fock (Tensor): the Fock representation
             modes (optional, Sequence[int]): the modes in which the state is defined
             cutoffs (Sequence[int], default=None): set to force the cutoff dimensions of the state
+            is_pure (optional, bool): whether the Gaussian state is known to be pure, which skips
+                computing its purity from the covariance matrix
             _norm (float, default=1.0): the norm of the state. Warning: only set if you know what you are doing.
 
         """
         self._purity = None
-        self._fock_probabilities = None
+        self._is_pure = None
+        self._fock_probabilities = {}
         self._cutoffs = cutoffs
         self._cov = cov
         self._means = means
@@ -91,10 +101,21 @@ class State:  # pylint: disable=too-many-public-methods
         self._symplectic = symplectic
         self._ket = ket
         self._dm = dm
+        self._ket_cutoffs = None
+        self._dm_cutoffs = None
+        self._bargmann = None
+        self._number_means = None
+        self._number_cov = None
         self._norm = _norm
         if cov is not None and means is not None:
             self.is_gaussian = True
-            self.is_hilbert_vector = np.allclose(gaussian.purity(self.cov), 1.0, atol=1e-6)
+            if is_pure is None:
+                self._purity = gaussian.purity(self.cov)
+                self._is_pure = np.isclose(self._purity, 1.0, atol=1e-6)
+            else:
+                self._purity = 1.0 if is_pure else None
+                self._is_pure = is_pure
+            self.is_hilbert_vector = self._is_pure
             self.num_modes = cov.shape[-1] // 2
         elif eigenvalues is not None and symplectic is not None:
             self.is_gaussian = True
@@ -105,11 +126,14 @@ class State:  # pylint: disable=too-many-public-methods
             self.is_hilbert_vector = ket is not None
             self.num_modes = len(ket.shape) if ket is not None else len(dm.shape) // 2
             self._purity = 1.0 if ket is not None else None
+            self._is_pure = True if ket is not None else None
         else:
             raise ValueError(
                 "State must be initialized with either a covariance matrix and means vector, an eigenvalues array and symplectic matrix, or a fock representation"
             )
         self._modes = modes
+        self._default_modes = None
+        self._mode_indices = None
         if modes is not None:
             assert (
                 len(modes) == self.num_modes
@@ -138,9 +162,11 @@ class State:  # pylint: disable=too-many-public-methods
     @property
     def modes(self):
         r"""Returns the modes of the state."""
-        if self._modes is None:
-            return list(range(self.num_modes))
-        return self._modes
+        if self._modes is not None:
+            return self._modes
+        if self._default_modes is None:
+            self._default_modes = list(range(self.num_modes))
+        return self._default_modes
 
     def indices(self, modes) -> Union[Tuple[int], int]:
         r"""Returns the indices of the given modes.
@@ -152,12 +178,24 @@ class State:  # pylint: disable=too-many-public-methods
             Tuple[int] or int: a tuple of indices of the given modes or the single index of a single mode
         """
         if isinstance(modes, int):
-            return self.modes.index(modes)
-        return tuple(self.modes.index(m) for m in modes)
+            return self._mode_to_idx[modes]
+        return tuple(self._mode_to_idx[m] for m in modes)
+
+    @property
+    def _mode_to_idx(self) -> dict:
+        r"""A cached map from each mode of the state to its index.
+
+        Its keys also serve as the set of modes for constant-time membership tests.
+        """
+        if self._mode_indices is None:
+            self._mode_indices = {m: i for i, m in enumerate(self.modes)}
+        return self._mode_indices
 
     @property
     def purity(self) -> float:
         """Returns the purity of the state."""
+        if self.is_gaussian and not self._is_cacheable:
+            return gaussian.purity(self.cov)
         if self._purity is None:
             if self.is_gaussian:
                 self._purity = gaussian.purity(self.cov)
@@ -173,7 +211,16 @@ class State:  # pylint: disable=too-many-public-methods
     @property
     def is_pure(self):
         r"""Returns ``True`` if the state is pure and ``False`` otherwise."""
-        return np.isclose(self.purity, 1.0, atol=1e-6)
+        if self.is_gaussian and not self._is_cacheable:
+            return np.isclose(self.purity, 1.0, atol=1e-6)
+        if self._is_pure is None:
+            purity = self.purity
+            # a purity set exactly (e.g. for a ket) needs no tolerance check
+            if isinstance(purity, float) and purity == 1.0:
+                self._is_pure = True
+            else:
+                self._is_pure = np.isclose(purity, 1.0, atol=1e-6)
+        return self._is_pure
 
     @property
     def means(self) -> Optional[RealVector]:
@@ -246,7 +293,9 @@ class State:  # pylint: disable=too-many-public-methods
     def number_means(self) -> RealVector:
         r"""Returns the mean photon number for each mode."""
         if self.is_gaussian:
-            return gaussian.number_means(self.cov, self.means)
+            if self._number_means is None or not self._is_cacheable:
+                self._number_means = gaussian.number_means(self.cov, self.means)
+            return self._number_means
 
         return fock.number_means(tensor=self.fock, is_dm=self.is_mixed)
 
@@ -256,7 +305,9 @@ class State:  # pylint: disable=too-many-public-methods
         if not self.is_gaussian:
             raise NotImplementedError("number_cov not yet implemented for non-gaussian states")
 
-        return gaussian.number_cov(self.cov, self.means)
+        if self._number_cov is None or not self._is_cacheable:
+            self._number_cov = gaussian.number_cov(self.cov, self.means)
+        return self._number_cov
 
     @property
     def norm(self) -> float:
@@ -273,6 +324,28 @@ class State:  # pylint: disable=too-many-public-methods
             return norm**2
         return norm
 
+    @property
+    def _is_cacheable(self) -> bool:
+        r"""Whether the representations computed from the Gaussian data of the state can be
+        reused between calls. This is not the case for states with trainable parameters,
+        whose covariance matrix and means vector are recomputed from the parameter values."""
+        return not getattr(self.parameter_set, "variables", None)
+
+    @staticmethod
+    def _covers(cached_cutoffs: Optional[List[int]], cutoffs: List[int]) -> bool:
+        r"""Whether amplitudes computed up to ``cached_cutoffs`` contain those up to ``cutoffs``."""
+        return cached_cutoffs is not None and all(
+            c <= cached for c, cached in zip(cutoffs, cached_cutoffs)
+        )
+
+    def _full_cutoffs(self, cutoffs: Optional[Sequence[Optional[int]]]) -> List[int]:
+        r"""Returns the given cutoffs with the ``None`` entries replaced by those of the state."""
+        if cutoffs is None:
+            return self.cutoffs
+        if None not in cutoffs:
+            return list(cutoffs)
+        return [c if c is not None else default for c, default in zip(cutoffs, self.cutoffs)]
+
     def ket(
         self,
         cutoffs: List[int] = None,
@@ -295,34 +368,34 @@ class State:  # pylint: disable=too-many-public-methods
         if self.is_mixed:
             return None
 
-        if cutoffs is None:
-            cutoffs = self.cutoffs
-        else:
-            cutoffs = [c if c is not None else self.cutoffs[i] for i, c in enumerate(cutoffs)]
+        cutoffs = self._full_cutoffs(cutoffs)
 
         if self.is_gaussian:
-            self._ket = fock.wigner_to_fock_state(
-                self.cov,
-                self.means,
-                shape=cutoffs,
-                return_dm=False,
-                max_prob=max_prob,
-                max_photons=max_photons,
-            )
+            cacheable = max_prob == 1.0 and max_photons is None and self._is_cacheable
+            if not (cacheable and self._covers(self._ket_cutoffs, cutoffs)):
+                self._ket = fock.wigner_to_fock_state(
+                    self.cov,
+                    self.means,
+                    shape=cutoffs,
+                    return_dm=False,
+                    max_prob=max_prob,
+                    max_photons=max_photons,
+                )
+                self._ket_cutoffs = cutoffs if cacheable else None
+            ket = self._ket
         else:  # only fock representation is available
             if self._ket is None:
                 # if state is pure and has a density matrix, calculate the ket
                 if self.is_pure:
                     self._ket = fock.dm_to_ket(self._dm)
-            current_cutoffs = [int(s) for s in self._ket.shape]
-            if cutoffs != current_cutoffs:
-                paddings = [(0, max(0, new - old)) for new, old in zip(cutoffs, current_cutoffs)]
-                if any(p != (0, 0) for p in paddings):
-                    padded = fock.math.pad(self._ket, paddings, mode="constant")
-                else:
-                    padded = self._ket
-                return padded[tuple(slice(s) for s in cutoffs)]
-        return self._ket[tuple(slice(s) for s in cutoffs)]
+            ket = self._ket
+            deltas = np.maximum(0, np.subtract(cutoffs, ket.shape))
+            if deltas.any():
+                paddings = [(0, d) for d in deltas.tolist()]
+                ket = fock.math.pad(ket, paddings, mode="constant")
+        if tuple(ket.shape) == tuple(cutoffs):
+            return ket
+        return ket[tuple(slice(s) for s in cutoffs)]
 
     def dm(self, cutoffs: Optional[List[int]] = None) -> ComplexTensor:
         r"""Returns the density matrix of the state in Fock representation.
@@ -334,27 +407,28 @@ class State:  # pylint: disable=too-many-public-methods
         Returns:
             Tensor: the density matrix
         """
-        if cutoffs is None:
-            cutoffs = self.cutoffs
-        else:
-            cutoffs = [c if c is not None else self.cutoffs[i] for i, c in enumerate(cutoffs)]
-        if self.is_pure:
-            ket = self.ket(cutoffs=cutoffs)
-            if ket is not None:
-                return fock.ket_to_dm(ket)
-        else:
-            if self.is_gaussian:
+        cutoffs = self._full_cutoffs(cutoffs)
+        # a pure state given only as a dm is sliced directly, rather than
+        # going through dm -> ket -> dm
+        if self.is_pure and (self.is_gaussian or self._ket is not None):
+            return fock.ket_to_dm(self.ket(cutoffs=cutoffs))
+        double_cutoffs = cutoffs + cutoffs
+        if self.is_gaussian:
+            if not (self._is_cacheable and self._covers(self._dm_cutoffs, cutoffs)):
                 self._dm = fock.wigner_to_fock_state(
-                    self.cov, self.means, shape=cutoffs + cutoffs, return_dm=True
+                    self.cov, self.means, shape=double_cutoffs, return_dm=True
                 )
-            elif cutoffs != (current_cutoffs := list(self._dm.shape[: self.num_modes])):
-                paddings = [(0, max(0, new - old)) for new, old in zip(cutoffs, current_cutoffs)]
-                if any(p != (0, 0) for p in paddings):
-                    padded = fock.math.pad(self._dm, paddings + paddings, mode="constant")
-                else:
-                    padded = self._dm
-                return padded[tuple(slice(s) for s in cutoffs + cutoffs)]
-        return self._dm[tuple(slice(s) for s in cutoffs + cutoffs)]
+                self._dm_cutoffs = cutoffs if self._is_cacheable else None
+            dm = self._dm
+        else:
+            dm = self._dm
+            deltas = np.maximum(0, np.subtract(cutoffs, dm.shape[: self.num_modes]))
+            if deltas.any():
+                paddings = [(0, d) for d in deltas.tolist()]
+                dm = fock.math.pad(dm, paddings + paddings, mode="constant")
+        if tuple(dm.shape) == tuple(double_cutoffs):
+            return dm
+        return dm[tuple(slice(s) for s in double_cutoffs)]
 
     def fock_probabilities(self, cutoffs: Sequence[int]) -> RealTensor:
         r"""Returns the probabilities in Fock representation.
@@ -368,14 +442,26 @@ class State:  # pylint: disable=too-many-public-methods
         Returns:
             Tensor: the probabilities
         """
-        if self._fock_probabilities is None:
-            if self.is_mixed:
-                dm = self.dm(cutoffs=cutoffs)
-                self._fock_probabilities = fock.dm_to_probs(dm)
+        key = tuple(cutoffs)
+        if key not in self._fock_probabilities:
+            if self.is_mixed and self.is_gaussian:
+                # only the diagonal of the density matrix is needed, so we don't compute the rest
+                A, B, C = self.bargmann()
+                probs = math.real(math.hermite_renormalized_diagonal(A, B, C, cutoffs=cutoffs))
+            elif self.is_mixed or (not self.is_gaussian and self._ket is None):
+                # a pure state stored only as a dm is not converted to a ket;
+                # reuse the stored dm if it already has the requested shape
+                dm = self._dm if tuple(self._dm.shape) == key + key else self.dm(cutoffs=cutoffs)
+                probs = fock.dm_to_probs(dm)
             else:
-                ket = self.ket(cutoffs=cutoffs)
-                self._fock_probabilities = fock.ket_to_probs(ket)
-        return self._fock_probabilities
+                # reuse the stored ket if it already has the requested shape
+                if self._ket is not None and tuple(self._ket.shape) == key:
+                    ket = self._ket
+                else:
+                    ket = self.ket(cutoffs=cutoffs)
+                probs = fock.ket_to_probs(ket)
+            self._fock_probabilities[key] = probs
+        return self._fock_probabilities[key]
 
     def primal(self, other: Union[State, Transformation]) -> State:
         r"""Returns the post-measurement state after ``other`` is projected onto ``self``.
@@ -423,7 +509,7 @@ class State:  # pylint: disable=too-many-public-methods
             State or float: returns the conditional state on the remaining modes
                 or the probability.
         """
-        remaining_modes = list(set(other.modes) - set(self.modes))
+        remaining_modes = [m for m in other.modes if m not in self._mode_to_idx]
 
         out_fock = self._contract_with_other(other)
         if len(remaining_modes) > 0:
@@ -434,31 +520,32 @@ class State:  # pylint: disable=too-many-public-methods
             )
 
         # return the probability (norm) of the state when there are no modes left
-        return (
-            fock.math.abs(out_fock) ** 2
-            if other.is_pure and self.is_pure
-            else fock.math.abs(out_fock)
-        )
+        if other.is_pure and self.is_pure:
+            # |z|^2 directly, without the square root of abs
+            re, im = math.real(out_fock), math.imag(out_fock)
+            return re * re + im * im
+        return math.abs(out_fock)
 
     def _contract_with_other(self, other):
-        other_cutoffs = [
-            None if m not in self.modes else other.cutoffs[other.indices(m)] for m in other.modes
-        ]
+        mode_indices = other.indices(self.modes)
         if hasattr(self, "_preferred_projection"):
-            out_fock = self._preferred_projection(other, other.indices(self.modes))
-        else:
-            # matching other's cutoffs
-            self_cutoffs = [other.cutoffs[other.indices(m)] for m in self.modes]
-            out_fock = fock.contract_states(
-                stateA=other.ket(other_cutoffs) if other.is_pure else other.dm(other_cutoffs),
-                stateB=self.ket(self_cutoffs) if self.is_pure else self.dm(self_cutoffs),
-                a_is_dm=other.is_mixed,
-                b_is_dm=self.is_mixed,
-                modes=other.indices(self.modes),
-                normalize=self._normalize if hasattr(self, "_normalize") else False,
-            )
-
-        return out_fock
+            return self._preferred_projection(other, mode_indices)
+
+        # matching other's cutoffs
+        cutoffs = other.cutoffs
+        self_cutoffs = [cutoffs[i] for i in mode_indices]
+        other_cutoffs = [None] * len(cutoffs)
+        for i, c in zip(mode_indices, self_cutoffs):
+            other_cutoffs[i] = c
+        other_is_pure, self_is_pure = other.is_pure, self.is_pure
+        return fock.contract_states(
+            stateA=other.ket(other_cutoffs) if other_is_pure else other.dm(other_cutoffs),
+            stateB=self.ket(self_cutoffs) if self_is_pure else self.dm(self_cutoffs),
+            a_is_dm=not other_is_pure,
+            b_is_dm=not self_is_pure,
+            modes=mode_indices,
+            normalize=self._normalize if hasattr(self, "_normalize") else False,
+        )
 
     def _project_onto_gaussian(self, other: State) -> Union[State, float]:
         """Returns the result of a generaldyne measurement given that states ``self`` and
@@ -473,7 +560,7 @@ class State:  # pylint: disable=too-many-public-methods
         """
         # here `self` is the measurement device state and `other` is the incoming state
         # being projected onto the measurement state
-        remaining_modes = list(set(other.modes) - set(self.modes))
+        remaining_modes = [m for m in other.modes if m not in self._mode_to_idx]
 
         _, probability, new_cov, new_means = gaussian.general_dyne(
             other.cov,
@@ -500,43 +587,57 @@ class State:  # pylint: disable=too-many-public-methods
     def __and__(self, other: State) -> State:
         r"""Concatenates two states."""
         if not self.is_gaussian or not other.is_gaussian:  # convert all to fock now
-            # TODO: would be more efficient if we could keep pure states as kets
+            offset = max(self.modes) + 1
             if self.is_mixed or other.is_mixed:
-                self_fock = self.dm()
-                other_fock = other.dm()
-                dm = fock.math.tensordot(self_fock, other_fock, [[], []])
                 # e.g. self has shape [1,3,1,3] and other has shape [2,2]
                 # we want self & other to have shape [1,3,2,1,3,2]
-                # before transposing shape is [1,3,1,3]+[2,2]
-                self_idx = list(range(len(self_fock.shape)))
-                other_idx = list(range(len(self_idx), len(self_idx) + len(other_fock.shape)))
+                # so the outer product and the interleaving of the axes are done in one einsum,
+                # in which a pure state enters as its ket and bra, without forming its dm
+                n_self, n_other = self.num_modes, other.num_modes
+                letters = string.ascii_letters[: 2 * (n_self + n_other)]
+                ket_self, bra_self = letters[:n_self], letters[n_self : 2 * n_self]
+                ket_other = letters[2 * n_self : 2 * n_self + n_other]
+                bra_other = letters[2 * n_self + n_other :]
+                inputs, operands = [], []
+                for state, ket_idx, bra_idx in [
+                    (self, ket_self, bra_self),
+                    (other, ket_other, bra_other),
+                ]:
+                    if state.is_pure and (state.is_gaussian or state._ket is not None):
+                        ket = state.ket()
+                        inputs += [ket_idx, bra_idx]
+                        operands += [ket, math.conj(ket)]
+                    else:
+                        inputs.append(ket_idx + bra_idx)
+                        operands.append(state.dm())
+                subscripts = ",".join(inputs) + f"->{ket_self}{ket_other}{bra_self}{bra_other}"
                 return State(
-                    dm=math.transpose(
-                        dm,
-                        self_idx[: len(self_idx) // 2]
-                        + other_idx[: len(other_idx) // 2]
-                        + self_idx[len(self_idx) // 2 :]
-                        + other_idx[len(other_idx) // 2 :],
-                    ),
-                    modes=self.modes + [m + max(self.modes) + 1 for m in other.modes],
+                    dm=math.einsum(subscripts, *operands),
+                    modes=[*self.modes, *(m + offset for m in other.modes)],
                 )
             # else, all states are pure
             self_fock = self.ket()
             other_fock = other.ket()
             return State(
-                ket=fock.math.tensordot(self_fock, other_fock, [[], []]),
-                modes=self.modes + [m + max(self.modes) + 1 for m in other.modes],
+                ket=math.outer(self_fock, other_fock),
+                modes=[*self.modes, *(m + offset for m in other.modes)],
             )
         cov = gaussian.join_covs([self.cov, other.cov])
         means = gaussian.join_means([self.means, other.means])
+        offset = self.num_modes
         return State(
             cov=cov,
             means=means,
-            modes=self.modes + [m + self.num_modes for m in other.modes],
+            modes=[*self.modes, *(m + offset for m in other.modes)],
+            is_pure=self.is_pure and other.is_pure,
         )
 
     def __getitem__(self, item) -> State:
-        "setting the modes of a state (same API of `Transformation`)"
+        r"""Returns the state on the given modes (same API of `Transformation`).
+
+        The state itself is left untouched: a shallow copy that shares its representation
+        is relabelled instead, so that cached quantities of ``self`` stay valid.
+        """
         if isinstance(item, int):
             item = [item]
         elif isinstance(item, Iterable):
@@ -547,20 +648,37 @@ class State:  # pylint: disable=too-many-public-methods
             raise ValueError(
                 f"there are {self.num_modes} modes (item has {len(item)} elements, perhaps you're looking for .get_modes()?)"
             )
-        self._modes = item
-        return self
+        if item == self.modes:
+            return self
+        state = copy(self)
+        state._modes = item
+        return state
+
+    def __copy__(self) -> State:
+        r"""Returns a shallow copy of the state.
+
+        The covariance matrix, the means vector and the Fock tensors are shared with ``self``
+        by reference, only the map from modes to indices is reset.
+        """
+        state = object.__new__(type(self))
+        state.__dict__.update(self.__dict__)
+        state._mode_indices = None
+        return state
 
     def bargmann(self, numpy=False) -> Optional[tuple[ComplexMatrix, ComplexVector, complex]]:
         r"""Returns the Bargmann representation of the state.
         If numpy=True, returns the numpy arrays instead of the backend arrays.
         """
-        if self.is_gaussian:
+        if not self.is_gaussian:
+            return None
+        if self._bargmann is not None and self._is_cacheable:
+            A, B, C = self._bargmann
+        else:
             if self.is_pure:
                 A, B, C = bargmann.wigner_to_bargmann_psi(self.cov, self.means)
             else:
                 A, B, C = bargmann.wigner_to_bargmann_rho(self.cov, self.means)
-        else:
-            return None
+            self._bargmann = (A, B, C)
         if numpy:
             return math.asnumpy(A), math.asnumpy(B), math.asnumpy(C)
         return A, B, C
@@ -577,17 +695,20 @@ class State:  # pylint: disable=too-many-public-methods
         if item == self.modes:
             return self
 
-        if not set(item) & set(self.modes):
+        if not any(m in self._mode_to_idx for m in item):
             raise ValueError(
                 f"Failed to request modes {item} for state {self} on modes {self.modes}."
             )
-        item_idx = [self.modes.index(m) for m in item]
+        item_idx = list(self.indices(item))
         if self.is_gaussian:
             cov, _, _ = gaussian.partition_cov(self.cov, item_idx)
             means, _ = gaussian.partition_means(self.means, item_idx)
             return State(cov=cov, means=means, modes=item)
 
-        fock_partitioned = fock.trace(self.dm(self.cutoffs), keep=item_idx)
+        if self._ket is not None:
+            fock_partitioned = fock.ket_trace(self.ket(self.cutoffs), keep=item_idx)
+        else:
+            fock_partitioned = fock.trace(self.dm(self.cutoffs), keep=item_idx)
         return State(dm=fock_partitioned, modes=item)
 
     def __eq__(self, other) -> bool:  # pylint: disable=too-many-return-statements
@@ -602,22 +723,22 @@ class State:  # pylint: disable=too-many-public-methods
             if not np.allclose(self.cov, other.cov, atol=1e-6):
                 return False
             return True
-        try:
+        # the purities match, so either both states are pure or both are mixed
+        if self.is_pure and other.is_pure:
             return np.allclose(
                 self.ket(cutoffs=other.cutoffs),
                 other.ket(cutoffs=other.cutoffs),
                 atol=1e-6,
             )
-        except TypeError:
-            return np.allclose(
-                self.dm(cutoffs=other.cutoffs),
-                other.dm(cutoffs=other.cutoffs),
-                atol=1e-6,
-            )
+        return np.allclose(
+            self.dm(cutoffs=other.cutoffs),
+            other.dm(cutoffs=other.cutoffs),
+            atol=1e-6,
+        )
 
     def __rshift__(self, other: Transformation) -> State:
         r"""Applies other (a Transformation) to self (a State), e.g., ``Coherent(x=0.1) >> Sgate(r=0.1)``."""
-        if issubclass(other.__class__, State):
+        if isinstance(other, State):
             raise TypeError(
                 f"Cannot apply {other.__class__.__qualname__} to a state. Are you looking for the << operator?"
             )
@@ -673,11 +794,11 @@ class State:  # pylint: disable=too-many-public-methods
         raise ValueError("No fock representation available")
 
     @staticmethod
-    def _format_probability(prob: float) -> str:
-        if prob < 0.001:
-            return f"{100*prob:.3e} %"
-        else:
-            return f"{prob:.3%}"
+    def _format_probability(prob: Optional[float]) -> str:
+        if prob is None:
+            return "None"
+        prob = float(prob)
+        return _SMALL_PROB_FMT(100 * prob) if prob < 0.001 else _PROB_FMT(prob)
 
     def _repr_markdown_(self):
         table = (
@@ -689,7 +810,7 @@ class State:  # pylint: disable=too-many-public-methods
             + f" | {self.num_modes} | {'1' if self.is_gaussian else 'N/A'} | {'✅' if self.is_gaussian else '❌'} | {'✅' if self._ket is not None or self._dm is not None else '❌'} |"
         )
 
-        if self.num_modes == 1:
+        if self.num_modes == 1 and settings.REPR_SHOW_WIGNER:
             mikkel_plot(math.asnumpy(self.dm(cutoffs=self.cutoffs)))
 
         if settings.DEBUG:
@@ -743,6 +864,8 @@ def mikkel_plot(
 
     q, ProbX = fock.quadrature_distribution(rho)
     p, ProbP = fock.quadrature_distribution(rho, np.pi / 2)
+    probx_max = np.max(ProbX)
+    probp_max = np.max(ProbP)
 
     xvec = np.linspace(*xbounds, plot_args["resolution"])
     pvec = np.linspace(*ybounds, plot_args["resolution"])
@@ -760,7 +883,8 @@ def mikkel_plot(
 
     # Wigner function
 
-    ax[1][0].contourf(X, P, W, 120, cmap=plot_args["cmap"], vmin=-abs(W).max(), vmax=abs(W).max())
+    w_max = np.abs(W).max()
+    ax[1][0].contourf(X, P, W, 120, cmap=plot_args["cmap"], vmin=-w_max, vmax=w_max)
     ax[1][0].set_xlabel("x", fontsize=12)
     ax[1][0].set_ylabel("p", fontsize=12)
     ax[1][0].get_xaxis().set_ticks(plot_args["xticks"])
@@ -781,7 +905,7 @@ def mikkel_plot(
     ax[0][0].tick_params(direction="in")
     ax[0][0].set_ylabel("Prob(x)", fontsize=12)
     ax[0][0].set_xlim(xbounds)
-    ax[0][0].set_ylim([0, 1.1 * max(ProbX)])
+    ax[0][0].set_ylim([0, 1.1 * probx_max])
     ax[0][0].grid(plot_args["grid"])
 
     # P quadrature probability distribution
@@ -792,12 +916,21 @@ def mikkel_plot(
     ax[1][1].yaxis.set_ticklabels([])
     ax[1][1].tick_params(direction="in")
     ax[1][1].set_xlabel("Prob(p)", fontsize=12)
-    ax[1][1].set_xlim([0, 1.1 * max(ProbP)])
+    ax[1][1].set_xlim([0, 1.1 * probp_max])
     ax[1][1].set_ylim(ybounds)
     ax[1][1].grid(plot_args["grid"])
 
     # Density matrix
-    ax[0][1].matshow(abs(rho), cmap=plot_args["cmap"], vmin=-abs(rho).max(), vmax=abs(rho).max())
+    abs_rho = np.abs(rho)
+    rho_max = abs_rho.max()
+    ax[0][1].imshow(
+        abs_rho,
+        cmap=plot_args["cmap"],
+        vmin=-rho_max,
+        vmax=rho_max,
+        interpolation="nearest",
+        origin="upper",
+    )
     ax[0][1].set_title("abs(ρ)", fontsize=12)
     ax[0][1].tick_params(direction="in")
     ax[0][1].get_xaxis().set_ticks([])
@@ -112,7 +112,8 @@ class Transformation(Tensor):
         Returns:
             State: the transformed state
         """
-        X, Y, d = self.XYd(allow_none=False) if not dual else self.XYd_dual(allow_none=False)
+        # missing elements of the triple (e.g. the Y of a unitary) are skipped by CPTP
+        X, Y, d = self.XYd() if not dual else self.XYd_dual()
         cov, means = gaussian.CPTP(
             math.astensor(state.cov),
             math.astensor(state.means),
@@ -122,8 +123,13 @@ class Transformation(Tensor):
             state.modes,
             self.modes,
         )
+        # a unitary preserves the purity of the state
         new_state = State(
-            cov=cov, means=means, modes=state.modes, _norm=state.norm
+            cov=cov,
+            means=means,
+            modes=state.modes,
+            is_pure=state.is_pure if self.is_unitary else None,
+            _norm=state.norm,
         )  # NOTE: assumes modes don't change
         return new_state
 
@@ -149,25 +155,15 @@ class Transformation(Tensor):
 
     @property
     def X_matrix_dual(self) -> Optional[RealMatrix]:
-        if (X := self.X_matrix) is None:
-            return None
-        return gaussian.math.inv(X)
+        return self.XYd_dual()[0]
 
     @property
     def Y_matrix_dual(self) -> Optional[RealMatrix]:
-        if (Y := self.Y_matrix) is None:
-            return None
-        if (Xdual := self.X_matrix_dual) is None:
-            return Y
-        return math.matmul(math.matmul(Xdual, Y), math.transpose(Xdual))
+        return self.XYd_dual()[1]
 
     @property
     def d_vector_dual(self) -> Optional[RealVector]:
-        if (d := self.d_vector) is None:
-            return None
-        if (Xdual := self.X_matrix_dual) is None:
-            return -d
-        return -math.matmul(Xdual, d)
+        return self.XYd_dual()[2]
 
     def bargmann(self, numpy=False):
         X, Y, d = self.XYd(allow_none=False)
@@ -229,11 +225,12 @@ class Transformation(Tensor):
 
         Override in subclasses if computing ``X``, ``Y`` and ``d`` together is more efficient.
         """
+        X, Y, d = self.X_matrix, self.Y_matrix, self.d_vector
         if allow_none:
-            return self.X_matrix, self.Y_matrix, self.d_vector
-        X = math.eye(2 * self.num_modes) if self.X_matrix is None else self.X_matrix
-        Y = math.zeros_like(X) if self.Y_matrix is None else self.Y_matrix
-        d = math.zeros_like(X[:, 0]) if self.d_vector is None else self.d_vector
+            return X, Y, d
+        X = math.eye(2 * self.num_modes) if X is None else X
+        Y = math.zeros_like(X) if Y is None else Y
+        d = math.zeros_like(X[:, 0]) if d is None else d
         return X, Y, d
 
     def XYd_dual(
@@ -243,11 +240,25 @@ class Transformation(Tensor):
 
         Override in subclasses if computing ``Xdual``, ``Ydual`` and ``ddual`` together is more efficient.
         """
+        X, Y, d = self.XYd(allow_none=True)
+        Xdual = None if X is None else math.inv(X)
+        if Y is None:
+            Ydual = None
+        elif Xdual is None:
+            Ydual = Y
+        else:
+            Ydual = math.matmul(math.matmul(Xdual, Y), math.transpose(Xdual))
+        if d is None:
+            ddual = None
+        elif Xdual is None:
+            ddual = -d
+        else:
+            ddual = -math.matmul(Xdual, d)
         if allow_none:
-            return self.X_matrix_dual, self.Y_matrix_dual, self.d_vector_dual
-        Xdual = math.eye(2 * self.num_modes) if self.X_matrix_dual is None else self.X_matrix_dual
-        Ydual = math.zeros_like(Xdual) if self.Y_matrix_dual is None else self.Y_matrix_dual
-        ddual = math.zeros_like(Xdual[:, 0]) if self.d_vector_dual is None else self.d_vector_dual
+            return Xdual, Ydual, ddual
+        Xdual = math.eye(2 * self.num_modes) if Xdual is None else Xdual
+        Ydual = math.zeros_like(Xdual) if Ydual is None else Ydual
+        ddual = math.zeros_like(Xdual[:, 0]) if ddual is None else ddual
         return Xdual, Ydual, ddual
 
     def __getitem__(self, items) -> Callable:
@@ -319,9 +330,9 @@ class Transformation(Tensor):
         class_name = self.name
         modes = self.modes
 
-        parameters = {k: v for k, v in self.__dict__.items() if isinstance(v, (Constant, Variable))}
         param_str_rep = [
-            f"{name}={repr(math.asnumpy(par.value))}" for name, par in parameters.items()
+            f"{name}={repr(math.asnumpy(par.value))}"
+            for name, par in self.parameter_set.all_parameters.items()
         ]
 
         params_str = ", ".join(sorted(param_str_rep))
@@ -369,6 +380,14 @@ class Unitary(Transformation):
         modes: The modes that this unitary acts on.
     """
 
+    # photon number selection rule of two-mode gates: ``"sum"`` if the gate conserves the
+    # total photon number and ``"difference"`` if it conserves the photon number difference
+    _selection_rule: Optional[str] = None
+
+    # whether the gate is diagonal in the Fock basis (like the rotation gate), in which case
+    # ``U(diag_only=True)`` returns its diagonal
+    _is_diagonal: bool = False
+
     def __init__(self, name: str, modes: list[int]):
         super().__init__(name=name, modes_in_ket=modes, modes_out_ket=modes)
         self.is_unitary = True
@@ -378,7 +397,21 @@ class Unitary(Transformation):
 
     def _transform_fock(self, state: State, dual=False) -> State:
         op_idx = [state.modes.index(m) for m in self.modes]
+        if self._is_diagonal:
+            diag = self.U(cutoffs=[state.cutoffs[i] for i in op_idx], diag_only=True)
+            if state.is_hilbert_vector:
+                ket = fock.apply_diagonal_gate_to_ket(diag, state.ket(), op_idx)
+                return State(ket=ket, modes=state.modes)
+            dm = fock.apply_diagonal_gate_to_dm(diag, state.dm(), op_idx)
+            return State(dm=dm, modes=state.modes)
         U = self.U(cutoffs=[state.cutoffs[i] for i in op_idx])
+        if self._selection_rule is not None and math.backend_name == "numpy":
+            diff = self._selection_rule == "difference"
+            if state.is_hilbert_vector:
+                ket = fock.apply_twomode_gate_to_ket(U, state.ket(), op_idx, diff)
+                return State(ket=ket, modes=state.modes)
+            dm = fock.apply_twomode_gate_to_dm(U, state.dm(), op_idx, diff)
+            return State(dm=dm, modes=state.modes)
         if state.is_hilbert_vector:
             return State(ket=fock.apply_kraus_to_ket(U, state.ket(), op_idx), modes=state.modes)
         return State(dm=fock.apply_kraus_to_dm(U, state.dm(), op_idx), modes=state.modes)
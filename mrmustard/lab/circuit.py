@@ -20,10 +20,12 @@ from __future__ import annotations
 
 __all__ = ["Circuit"]
 
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
 
-from mrmustard import settings
+from mrmustard import math, settings
 from mrmustard.lab.abstract import State, Transformation
+from mrmustard.physics import gaussian
 from mrmustard.utils.typing import RealMatrix, RealVector
 from mrmustard.lab.circuit_drawer import circuit_text
 from mrmustard.math.tensor_wrappers import XPMatrix, XPVector
@@ -54,52 +56,320 @@ class Circuit(Transformation):
         """Resets the state of the circuit clearing the list of modes and setting the compiled flag to false."""
         self._compiled: bool = False
         self._modes: List[int] = []
+        self._fused_cache: dict = {}
+        self._xyd_cache: dict = {}
+
+    @property
+    def _is_cacheable(self) -> bool:
+        r"""Whether quantities derived from the operations can be reused between calls, i.e.
+        whether none of the operations (or of the operations of nested circuits) is trainable."""
+        return not any(
+            op.parameter_set.variables or (isinstance(op, Circuit) and not op._is_cacheable)
+            for op in self._ops
+        )
+
+    def _cache_key(self) -> tuple:
+        r"""Identifies the operations of the circuit, their modes and the relevant settings."""
+        return (settings.HBAR, tuple((id(op), tuple(op.modes)) for op in self._ops))
 
     @property
     def num_modes(self) -> int:
-        all_modes = {mode for op in self._ops for mode in op.modes}
-        return len(all_modes)
+        return len(set().union(*(op.modes for op in self._ops)))
 
     def primal(self, state: State) -> State:
+        if state.is_gaussian and self._is_gaussian_chain:
+            return self._transform_gaussian(state, dual=False)
         for op in self._ops:
             state = op.primal(state)
         return state
 
     def dual(self, state: State) -> State:
+        if state.is_gaussian and self._is_gaussian_chain:
+            return self._transform_gaussian(state, dual=True)
         for op in reversed(self._ops):
             state = op.dual(state)
         return state
 
+    def call_batch(self, states: Sequence[State]) -> List[State]:
+        r"""Applies the circuit to each of the given states.
+
+        If the circuit is a flat sequence of Gaussian operations and the states are Gaussian
+        states on the same modes, the ``(X, Y, d)`` triple of the circuit is composed once and
+        applied to all the covariance matrices and means vectors together with batched matrix
+        products. Otherwise, the states are transformed one at a time.
+
+        Args:
+            states (Sequence[State]): the states to transform
+
+        Returns:
+            List[State]: the transformed states
+        """
+        states = list(states)
+        if not states:
+            return []
+        modes = list(states[0].modes)
+        op_modes = {m for op in self._ops for m in op.modes}
+        if not (
+            self._is_gaussian_chain
+            and op_modes.issubset(modes)
+            and all(s.is_gaussian and list(s.modes) == modes for s in states)
+        ):
+            return [self.primal(state) for state in states]
+
+        X, Y, d = self._XYd_on_modes(modes)
+        covs = math.astensor([state.cov for state in states])  # shape (B, 2n, 2n)
+        means = math.astensor([state.means for state in states])  # shape (B, 2n)
+        if X is not None:
+            covs = math.matmul(X, covs, math.transpose(X))
+            means = math.matmul(means, math.transpose(X))
+        if Y is not None:
+            covs = covs + Y
+        if d is not None:
+            means = means + d
+        return [
+            State(
+                cov=covs[i],
+                means=means[i],
+                modes=state.modes,
+                is_pure=state.is_pure if self.is_unitary else None,
+                _norm=state.norm,
+            )
+            for i, state in enumerate(states)
+        ]
+
+    def _XYd_on_modes(self, modes: List[int]) -> Tuple[RealMatrix, RealMatrix, RealVector]:
+        r"""Returns the ``(X, Y, d)`` triple of the whole circuit acting on all of ``modes``.
+
+        Unlike :meth:`XYd`, whose parts only span the modes they act on, every part of the
+        triple spans all of ``modes``. It is stored in the same cache as :meth:`XYd`, keyed by
+        the modes, so it is only composed again when circuits with trainable parameters are
+        called or when the modes change.
+        """
+        if self._is_cacheable:
+            key = self._cache_key()
+            cached_key, triple = self._xyd_cache.get(tuple(modes), (None, None))
+            if cached_key == key:
+                return triple
+
+        X, Y, d = self._compose_XYd(self._ops, modes, dual=False)
+        n = len(modes)
+        if X is not None and X.shape[-1] == 2 and n > 1:
+            X = math.single_mode_to_multimode_mat(X, n)
+        if Y is not None and Y.shape[-1] == 2 and n > 1:
+            Y = math.single_mode_to_multimode_mat(Y, n)
+        if d is not None and d.shape[-1] == 2 and n > 1:
+            d = math.single_mode_to_multimode_vec(d, n)
+
+        if self._is_cacheable:
+            self._xyd_cache[tuple(modes)] = (key, (X, Y, d))
+        return X, Y, d
+
+    def _transform_gaussian(self, state: State, dual: bool) -> State:
+        r"""Transforms a Gaussian state by applying all the operations of the circuit.
+
+        The covariance matrix and the means vector are threaded through the operations
+        directly, so that no intermediate states are created.
+
+        Args:
+            state (State): the state to transform
+            dual (bool): whether to apply the dual channel
+
+        Returns:
+            State: the transformed state
+        """
+        cov = math.astensor(state.cov)
+        means = math.astensor(state.means)
+        for X, Y, d, modes in self._fused_XYd(dual):
+            cov, means = gaussian.CPTP(cov, means, X, Y, d, state.modes, modes)
+        return State(
+            cov=cov,
+            means=means,
+            modes=state.modes,
+            is_pure=state.is_pure if self.is_unitary else None,
+            _norm=state.norm,
+        )
+
+    def _fused_XYd(self, dual: bool) -> List[Tuple[RealMatrix, RealMatrix, RealVector, List[int]]]:
+        r"""Returns the ``(X, Y, d)`` triples of the circuit, fusing consecutive operations.
+
+        Consecutive operations are grouped as long as they act on at most
+        ``settings.CIRCUIT_FUSION_MAX_MODES`` modes altogether, and each group is pre-composed
+        into a single triple. This way the covariance matrix of the state is updated once per
+        group rather than once per operation.
+
+        If none of the operations has trainable parameters the triples can't change between
+        calls, so they are computed once and reused until the operations, their modes or the
+        relevant settings change.
+
+        Args:
+            dual (bool): whether to return the triples of the dual channel
+
+        Returns:
+            List[Tuple[Matrix, Matrix, Vector, List[int]]]: the ``X``, ``Y``, ``d`` triple of
+            each group and the modes it acts on
+        """
+        if not self._is_cacheable:
+            return list(self._iter_fused_XYd(dual))
+
+        key = (settings.CIRCUIT_FUSION_MAX_MODES, self._cache_key())
+        cached_key, triples = self._fused_cache.get(dual, (None, None))
+        if cached_key != key:
+            triples = list(self._iter_fused_XYd(dual))
+            self._fused_cache[dual] = (key, triples)
+        return triples
+
+    def _iter_fused_XYd(
+        self, dual: bool
+    ) -> Iterator[Tuple[RealMatrix, RealMatrix, RealVector, List[int]]]:
+        r"""Yields the fused ``(X, Y, d)`` triples of the circuit (see :meth:`_fused_XYd`)."""
+        group, group_modes = [], []
+        for op in reversed(self._ops) if dual else self._ops:
+            new_modes = group_modes + [m for m in op.modes if m not in group_modes]
+            if group and len(new_modes) > settings.CIRCUIT_FUSION_MAX_MODES:
+                yield self._compose_XYd(group, group_modes, dual) + (group_modes,)
+                group, new_modes = [], list(op.modes)
+            group.append(op)
+            group_modes = new_modes
+        if group:
+            yield self._compose_XYd(group, group_modes, dual) + (group_modes,)
+
+    @staticmethod
+    def _compose_XYd(
+        ops: List, modes: List[int], dual: bool
+    ) -> Tuple[RealMatrix, RealMatrix, RealVector]:
+        r"""Composes the ``(X, Y, d)`` triples of a sequence of operations acting on ``modes``.
+
+        Elements of the triples are ``None`` where the operations don't need them (e.g. the
+        ``Y`` of unitaries), so that ``gaussian.CPTP`` can skip them.
+        """
+        if len(ops) == 1 and list(ops[0].modes) == modes:
+            return ops[0].XYd_dual() if dual else ops[0].XYd()
+        n = len(modes)
+        X = math.eye(2 * n, dtype=math.float64)
+        Y = math.zeros((2 * n, 2 * n), dtype=math.float64)
+        d = math.zeros((2 * n,), dtype=math.float64)
+        position = {m: i for i, m in enumerate(modes)}
+        for op in ops:
+            op_modes = op.modes
+            opX, opY, opd = op.XYd_dual() if dual else op.XYd()
+            if opX is not None:
+                if opX.shape[-1] == 2 and len(op_modes) > 1:
+                    opX = math.single_mode_to_multimode_mat(opX, len(op_modes))
+                X = math.left_matmul_at_modes(opX, X, [position[m] for m in op_modes])
+            Y, d = gaussian.CPTP(Y, d, opX, opY, opd, modes, op_modes)
+        return X, Y, d
+
     def XYd(
         self,
         allow_none: bool = True,
     ) -> Tuple[
         RealMatrix, RealMatrix, RealVector
     ]:  # NOTE: Overriding Transformation.XYd for efficiency
+        if not self._is_cacheable:
+            return self._compute_XYd(allow_none)
+
+        key = self._cache_key()
+        cached_key, triple = self._xyd_cache.get(allow_none, (None, None))
+        if cached_key != key:
+            triple = self._compute_XYd(allow_none)
+            self._xyd_cache[allow_none] = (key, triple)
+        return triple
+
+    def _compute_XYd(self, allow_none: bool) -> Tuple[RealMatrix, RealMatrix, RealVector]:
+        r"""Composes the ``(X, Y, d)`` triple of the whole circuit (see :meth:`XYd`)."""
         X = XPMatrix(like_1=True)
         Y = XPMatrix(like_0=True)
         d = XPVector()
         for op in self._ops:
             opx, opy, opd = op.XYd(allow_none)
-            opX = XPMatrix.from_xxpp(opx, modes=(op.modes, op.modes), like_1=True)
-            opY = XPMatrix.from_xxpp(opy, modes=(op.modes, op.modes), like_0=True)
-            opd = XPVector.from_xxpp(opd, modes=op.modes)
-            if opX.shape is not None and opX.shape[-1] == 1 and len(op.modes) > 1:
-                opX = opX.clone(len(op.modes), modes=(op.modes, op.modes))
-            if opY.shape is not None and opY.shape[-1] == 1 and len(op.modes) > 1:
-                opY = opY.clone(len(op.modes), modes=(op.modes, op.modes))
-            if opd.shape is not None and opd.shape[-1] == 1 and len(op.modes) > 1:
-                opd = opd.clone(len(op.modes), modes=op.modes)
-            X = opX @ X
-            Y = opX @ Y @ opX.T + opY
-            d = opX @ d + opd
+            modes = op.modes
+            n = len(modes)
+            # each part is only built and applied if the operation has it
+            # (e.g. no X for pure noise, no Y for unitaries, no d for non-displacing ops)
+            if opx is not None:
+                opX = XPMatrix.from_xxpp(opx, modes=(modes, modes), like_1=True)
+                if opX.shape is not None and opX.shape[-1] == 1 and n > 1:
+                    opX = opX.clone(n, modes=(modes, modes))
+                X = opX @ X
+                Y = opX @ Y @ opX.T
+                d = opX @ d
+            if opy is not None:
+                opY = XPMatrix.from_xxpp(opy, modes=(modes, modes), like_0=True)
+                if opY.shape is not None and opY.shape[-1] == 1 and n > 1:
+                    opY = opY.clone(n, modes=(modes, modes))
+                Y = Y + opY
+            if opd is not None:
+                opD = XPVector.from_xxpp(opd, modes=modes)
+                if opD.shape is not None and opD.shape[-1] == 1 and n > 1:
+                    opD = opD.clone(n, modes=modes)
+                d = d + opD
         return X.to_xxpp(), Y.to_xxpp(), d.to_xxpp()
 
+    def compile(self) -> Callable[[], Tuple[RealMatrix, RealMatrix, RealVector]]:
+        r"""Compiles the circuit into a function that returns its ``(X, Y, d)`` triple.
+
+        Where each operation acts within the triple of the circuit only depends on the modes of
+        the operations, not on their parameters. This layout is worked out once for each
+        sequence of modes and reused, so the returned function only reads the current triples
+        of the operations and multiplies them into dense matrices, without the mode bookkeeping
+        of :meth:`XYd`. This makes it suitable for evaluating trainable circuits repeatedly.
+
+        Unlike :meth:`XYd`, the returned ``X``, ``Y`` and ``d`` are never ``None``.
+
+        Returns:
+            Callable: a function with no arguments returning the ``X``, ``Y``, ``d`` triple of
+            the circuit on its modes, in sorted order
+        """
+        _xyd_layout(tuple(tuple(op.modes) for op in self._ops))
+        self._compiled = True
+        return self._compiled_XYd
+
+    def _compiled_XYd(self) -> Tuple[RealMatrix, RealMatrix, RealVector]:
+        r"""Composes the dense ``(X, Y, d)`` triple of the circuit (see :meth:`compile`)."""
+        num_modes, layout = _xyd_layout(tuple(tuple(op.modes) for op in self._ops))
+        X = math.eye(2 * num_modes, dtype=math.float64)
+        Y = math.zeros((2 * num_modes, 2 * num_modes), dtype=math.float64)
+        d = math.zeros((2 * num_modes,), dtype=math.float64)
+        for op, indices in zip(self._ops, layout):
+            opX, opY, opd = op.XYd()
+            # ``indices`` is ``None`` if the operation acts on all the modes, in order, in which
+            # case the triples are composed with plain matrix products
+            n = num_modes if indices is None else len(indices)
+            if opX is not None and opX.shape[-1] == 2 and n > 1:
+                opX = math.single_mode_to_multimode_mat(opX, n)
+            if opY is not None and opY.shape[-1] == 2 and n > 1:
+                opY = math.single_mode_to_multimode_mat(opY, n)
+            if opd is not None and opd.shape[-1] == 2 and n > 1:
+                opd = math.single_mode_to_multimode_vec(opd, n)
+            if indices is None:
+                if opX is not None:
+                    X = math.matmul(opX, X)
+                    Y = math.matmul(opX, Y, math.transpose(opX))
+                    d = math.matvec(opX, d)
+                if opY is not None:
+                    Y = Y + opY
+                if opd is not None:
+                    d = d + opd
+                continue
+            if opX is not None:
+                X = math.left_matmul_at_modes(opX, X, indices)
+                Y = math.left_matmul_at_modes(opX, Y, indices)
+                Y = math.right_matmul_at_modes(Y, math.transpose(opX), indices)
+                d = math.matvec_at_modes(opX, d, indices)
+            Y = math.add_at_modes(Y, opY, indices)
+            d = math.add_at_modes(d, opd, indices)
+        return X, Y, d
+
     @property
     def is_gaussian(self):
         """Returns `true` if all operations in the circuit are Gaussian."""
         return all(op.is_gaussian for op in self._ops)
 
+    @property
+    def _is_gaussian_chain(self):
+        """Returns `true` if the circuit is a flat sequence of Gaussian operations."""
+        return all(op.is_gaussian and not isinstance(op, Circuit) for op in self._ops)
+
     @property
     def is_unitary(self):
         """Returns `true` if all operations in the circuit are unitary."""
@@ -139,3 +409,17 @@ class Circuit(Transformation):
         sX, sY, sd = self.XYd(allow_none=False)
         oX, oY, od = other.XYd(allow_none=False)
         return np.allclose(sX, oX) and np.allclose(sY, oY) and np.allclose(sd, od)
+
+
+@lru_cache
+def _xyd_layout(
+    ops_modes: Tuple[Tuple[int, ...], ...]
+) -> Tuple[int, Tuple[Optional[List[int]], ...]]:
+    r"""Returns the number of modes of a circuit whose operations act on ``ops_modes`` and,
+    for each operation, the positions of its modes among the sorted modes of the circuit, or
+    ``None`` if it acts on all of them in sorted order."""
+    all_modes = tuple(sorted(set().union(*ops_modes)))
+    position = {m: i for i, m in enumerate(all_modes)}
+    return len(position), tuple(
+        None if modes == all_modes else [position[m] for m in modes] for modes in ops_modes
+    )
@@ -269,7 +269,8 @@ class Generaldyne(Measurement):
         return super().primal(other)
 
     def _measure_gaussian(self, other) -> Union[State, float]:
-        remaining_modes = list(set(other.modes) - set(self.modes))
+        self_modes = set(self.modes)
+        remaining_modes = [m for m in other.modes if m not in self_modes]
 
         outcome, prob, new_cov, new_means = gaussian.general_dyne(
             other.cov, other.means, self.state.cov, None, modes=self.modes
@@ -392,10 +393,8 @@ class Homodyne(Generaldyne):
                 "Multimode Homodyne sampling for Fock representation is not yet implemented."
             )
 
-        other_cutoffs = [
-            None if m not in self.modes else other.cutoffs[other.indices(m)] for m in other.modes
-        ]
-        remaining_modes = list(set(other.modes) - set(self.modes))
+        self_modes = set(self.modes)
+        remaining_modes = [m for m in other.modes if m not in self_modes]
 
         # create reduced state of modes to be measured on the homodyne basis
         reduced_state = other.get_modes(self.modes)
@@ -414,12 +413,12 @@ class Homodyne(Generaldyne):
             r=self.r, phi=0.0, x=x_arg, y=0.0, modes=self.modes
         ) >> Rgate(self.quadrature_angle, modes=self.modes)
 
-        if remaining_modes == 0:
+        if not remaining_modes:
             return probability
 
         self_cutoffs = [other.cutoffs[other.indices(m)] for m in self.modes]
         other_cutoffs = [
-            None if m not in self.modes else other.cutoffs[other.indices(m)] for m in other.modes
+            None if m not in self_modes else other.cutoffs[other.indices(m)] for m in other.modes
         ]
         out_fock = fock.contract_states(
             stateA=other.ket(other_cutoffs) if other.is_pure else other.dm(other_cutoffs),
@@ -279,6 +279,7 @@ class Rgate(Unitary):
     is_gaussian = True
     short_name = "R"
     parallelizable = True
+    _is_diagonal = True
 
     def __init__(
         self,
@@ -314,14 +315,13 @@ class Rgate(Unitary):
         Args:
             cutoffs: cutoff dimension for each mode.
             shape: the shape of the unitary matrix
-            diag_only: if True, only return the diagonal of the unitary matrix.
+            diag_only: if True, only return the diagonal of the unitary matrix, with one
+                index per mode
 
         Returns:
             array[complex]: the unitary matrix
         """
         N = self.num_modes
-        if diag_only:
-            raise NotImplementedError("Rgate does not support diag_only=True yet")
         if cutoffs is None:
             pass
         elif len(cutoffs) == N:
@@ -336,23 +336,21 @@ class Rgate(Unitary):
         if shape is None:
             raise ValueError
 
-        angles = self.angle.value * math.ones(self.num_modes, dtype=self.angle.value.dtype)
-
-        # calculate rotation unitary for each mode and concatenate with outer product
-        Ur = None
-        for idx, cutoff in enumerate(shape[: self.num_modes]):
-            theta = math.arange(cutoff) * angles[idx]
-            if Ur is None:
-                Ur = math.diag(math.make_complex(math.cos(theta), math.sin(theta)))
-            else:
-                U_next = math.diag(math.make_complex(math.cos(theta), math.sin(theta)))
-                Ur = math.outer(Ur, U_next)
-
-        # return total unitary with indexes reordered according to MM convention
-        return math.transpose(
-            Ur,
-            list(range(0, 2 * self.num_modes, 2)) + list(range(1, 2 * self.num_modes, 2)),
-        )
+        N = self.num_modes
+        cutoffs = tuple(shape[:N])
+        angles = self.angle.value * math.ones(N, dtype=self.angle.value.dtype)
+
+        # the unitary is diagonal with phases ``sum_k n_k * angle_k``, which we compute
+        # for all the photon numbers ``n`` at once with a single matrix-vector product
+        photon_numbers = np.indices(cutoffs).reshape(N, -1).T
+        theta = math.matvec(math.astensor(photon_numbers, dtype=angles.dtype), angles)
+        phases = math.make_complex(math.cos(theta), math.sin(theta))
+        if diag_only:
+            return math.reshape(phases, cutoffs)
+        Ur = math.diag(phases)
+
+        # the indices of the reshaped diagonal are already in the MM order (out, in)
+        return math.reshape(Ur, cutoffs + cutoffs)
 
 
 class Pgate(Unitary):
@@ -484,6 +482,7 @@ class BSgate(Unitary):
     is_gaussian = True
     short_name = "BS"
     parallelizable = False
+    _selection_rule = "sum"
 
     def __init__(
         self,
@@ -629,6 +628,7 @@ class S2gate(Unitary):
     is_gaussian = True
     short_name = "S2"
     parallelizable = False
+    _selection_rule = "difference"
 
     def __init__(
         self,
@@ -693,12 +693,9 @@ class Interferometer(Unitary):
 
     @property
     def X_matrix(self):
-        return math.block(
-            [
-                [math.real(self.unitary.value), -math.imag(self.unitary.value)],
-                [math.imag(self.unitary.value), math.real(self.unitary.value)],
-            ]
-        )
+        unitary = self.unitary.value
+        re, im = math.real(unitary), math.imag(unitary)
+        return math.block([[re, -im], [im, re]])
 
     def _validate_modes(self, modes):
         if len(modes) != self.unitary.value.shape[-1]:
@@ -1059,17 +1056,14 @@ class PhaseNoise(Channel):
         indices += [idx, idx + M]
         dm = math.transpose(dm, indices)
 
+        # the element (m, n) of the mode of interest is damped by exp(-0.5 * sigma^2 * (m - n)^2);
+        # the damping is applied out of place so that the input state is left unchanged
+        k = np.arange(dm.shape[-1], dtype=np.float64)
         coeff = math.cast(
-            math.exp(
-                -0.5 * self.phase_stdev.value**2 * math.arange(-dm.shape[-2] + 1, dm.shape[-1]) ** 2
-            ),
+            math.exp(-0.5 * self.phase_stdev.value**2 * (k[:, None] - k[None, :]) ** 2),
             dm.dtype,
         )
-
-        for k in range(-dm.shape[-2] + 1, dm.shape[-1]):
-            diagonal = math.diag_part(dm, k=k)
-            diagonal *= coeff[k + dm.shape[-2] - 1]
-            dm = math.set_diag(dm, diagonal, k=k)
+        dm = dm * coeff
 
         # transpose dm back to the original order
         return State(dm=math.transpose(dm, np.argsort(indices)), modes=state.modes)
@@ -45,7 +45,7 @@ class Vacuum(State):
     def __init__(self, num_modes: int):
         cov = gaussian.vacuum_cov(num_modes)
         means = gaussian.vacuum_means(num_modes)
-        super().__init__(cov=cov, means=means)
+        super().__init__(cov=cov, means=means, is_pure=True)
 
 
 class Coherent(State):
@@ -103,7 +103,7 @@ class Coherent(State):
 
         means = gaussian.displacement(x, y)
         cov = gaussian.vacuum_cov(means.shape[-1] // 2)
-        super().__init__(cov=cov, means=means, cutoffs=cutoffs, modes=modes)
+        super().__init__(cov=cov, means=means, cutoffs=cutoffs, modes=modes, is_pure=True)
 
     @property
     def means(self):
@@ -167,7 +167,7 @@ class SqueezedVacuum(State):
         means = gaussian.vacuum_means(
             cov.shape[-1] // 2,
         )
-        super().__init__(cov=cov, means=means, cutoffs=cutoffs)
+        super().__init__(cov=cov, means=means, cutoffs=cutoffs, is_pure=True)
 
     @property
     def cov(self):
@@ -216,7 +216,7 @@ class TMSV(State):
 
         cov = gaussian.two_mode_squeezed_vacuum_cov(r, phi)
         means = gaussian.vacuum_means(2)
-        super().__init__(cov=cov, means=means, cutoffs=cutoffs)
+        super().__init__(cov=cov, means=means, cutoffs=cutoffs, is_pure=True)
 
     @property
     def cov(self):
@@ -344,7 +344,7 @@ class DisplacedSqueezed(State):
 
         cov = gaussian.squeezed_vacuum_cov(r, phi)
         means = gaussian.displacement(x, y)
-        super().__init__(cov=cov, means=means, cutoffs=cutoffs, modes=modes)
+        super().__init__(cov=cov, means=means, cutoffs=cutoffs, modes=modes, is_pure=True)
 
     @property
     def cov(self):
@@ -399,6 +399,9 @@ class Gaussian(State):
     ):
         if symplectic is None:
             symplectic = math.random_symplectic(num_modes=num_modes)
+        # the default eigenvalues are those of the vacuum, which makes the state pure
+        # as long as training can't change them
+        is_pure = True if eigenvalues is None and not eigenvalues_trainable else None
         if eigenvalues is None:
             eigenvalues = gaussian.math.ones(num_modes) * settings.HBAR / 2
         if math.any(math.atleast_1d(eigenvalues) < settings.HBAR / 2):
@@ -419,7 +422,7 @@ class Gaussian(State):
 
         cov = gaussian.gaussian_cov(symplectic, eigenvalues)
         means = gaussian.vacuum_means(cov.shape[-1] // 2)
-        super().__init__(cov=cov, means=means, cutoffs=cutoffs)
+        super().__init__(cov=cov, means=means, cutoffs=cutoffs, is_pure=is_pure)
 
     @property
     def cov(self):
@@ -150,8 +150,10 @@ class CircuitComponent:
                 of modes (e.g. for parallel gates).
         """
         if parameter.value.shape != ():
-            if len(parameter.value) != 1 and len(parameter.value) != len(self.modes):
-                msg = f"Length of ``{parameter.name}`` must be 1 or {len(self.modes)}."
+            # the number of modes is read from the wires, without sorting them
+            n_modes = len(self.wires.modes)
+            if len(parameter.value) != 1 and len(parameter.value) != n_modes:
+                msg = f"Length of ``{parameter.name}`` must be 1 or {n_modes}."
                 raise ValueError(msg)
         self.parameter_set.add_parameter(parameter)
         self.__dict__[parameter.name] = parameter
@@ -449,20 +451,25 @@ class CircuitComponent:
 
         Compares representations and wires, but not the other attributes (e.g. name and parameter set).
         """
-        return self.representation == other.representation and self.wires == other.wires
+        if self.wires != other.wires:
+            return False
+        # components sharing their representation (e.g. light copies) need no deep comparison
+        rep, other_rep = self.representation, other.representation
+        return rep is other_rep or rep == other_rep
 
     def _matmul_indices(self, other: CircuitComponent) -> tuple[tuple[int, ...], tuple[int, ...]]:
         r"""
         Finds the indices of the wires being contracted when ``self @ other`` is called.
         """
-        # find the indices of the wires being contracted on the bra side
-        bra_modes = tuple(self.wires.bra.output.modes & other.wires.bra.input.modes)
-        idx_z = self.wires.bra.output[bra_modes].indices
-        idx_zconj = other.wires.bra.input[bra_modes].indices
-        # find the indices of the wires being contracted on the ket side
-        ket_modes = tuple(self.wires.ket.output.modes & other.wires.ket.input.modes)
-        idx_z += self.wires.ket.output[ket_modes].indices
-        idx_zconj += other.wires.ket.input[ket_modes].indices
+        self_idx, other_idx = self.wires.index_dicts, other.wires.index_dicts
+        # find the modes being contracted on the bra side and on the ket side, in sorted order
+        bra_modes = [m for m in self.wires.sorted_args[0] if m in other.wires.args[1]]
+        ket_modes = [m for m in self.wires.sorted_args[2] if m in other.wires.args[3]]
+        # find the indices of the wires being contracted
+        idx_z = tuple(self_idx[0][m] for m in bra_modes) + tuple(self_idx[2][m] for m in ket_modes)
+        idx_zconj = tuple(other_idx[1][m] for m in bra_modes) + tuple(
+            other_idx[3][m] for m in ket_modes
+        )
         return idx_z, idx_zconj
 
     def __matmul__(self, other: CircuitComponent | Scalar) -> CircuitComponent:
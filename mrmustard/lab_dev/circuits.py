@@ -264,32 +264,29 @@ class Circuit:
 
         # if the circuit has no graph, compute it
         if not self._graph:
-            # a dictionary to store the ``ids`` of the dangling wires
-            ids_dangling_wires = {m: {"ket": None, "bra": None} for w in wires for m in w.modes}
+            # the ``ids`` of the dangling wires on the ket and bra sides, indexed by mode
+            num_modes = max((m for w in wires for m in w.modes), default=-1) + 1
+            dangling_ket = [None] * num_modes
+            dangling_bra = [None] * num_modes
 
-            # populate the graph
+            # populate the graph in a single pass, reading the ``ids`` of each ``Wires``
+            # directly rather than slicing it mode by mode
             for w in wires:
+                ids_out_bra, ids_in_bra, ids_out_ket, ids_in_ket = w.ids_dicts
+
                 # if there is a dangling wire, add a contraction
-                for m in w.input.ket.modes:  # ket side
-                    if ids_dangling_wires[m]["ket"]:
-                        self._graph[ids_dangling_wires[m]["ket"]] = w.input.ket[m].ids[0]
-                        ids_dangling_wires[m]["ket"] = None
-                for m in w.input.bra.modes:  # bra side
-                    if ids_dangling_wires[m]["bra"]:
-                        self._graph[ids_dangling_wires[m]["bra"]] = w.input.bra[m].ids[0]
-                        ids_dangling_wires[m]["bra"] = None
+                for ids, dangling in ((ids_in_ket, dangling_ket), (ids_in_bra, dangling_bra)):
+                    for m, id in ids.items():
+                        if dangling[m] is not None:
+                            self._graph[dangling[m]] = id
+                            dangling[m] = None
 
                 # update the dangling wires
-                for m in w.output.ket.modes:  # ket side
-                    if w.output.ket[m].ids:
-                        if ids_dangling_wires[m]["ket"]:
-                            raise ValueError("Dangling wires cannot be overwritten.")
-                        ids_dangling_wires[m]["ket"] = w.output.ket[m].ids[0]
-                for m in w.output.bra.modes:  # bra side
-                    if w.output.bra[m].ids:
-                        if ids_dangling_wires[m]["bra"]:
+                for ids, dangling in ((ids_out_ket, dangling_ket), (ids_out_bra, dangling_bra)):
+                    for m, id in ids.items():
+                        if dangling[m] is not None:
                             raise ValueError("Dangling wires cannot be overwritten.")
-                        ids_dangling_wires[m]["bra"] = w.output.bra[m].ids[0]
+                        dangling[m] = id
 
         # use ``self._graph`` to validate the path
         remaining = dict(enumerate(wires))
@@ -325,15 +322,19 @@ class Circuit:
         """
         return len(self.components)
 
+    # pylint: disable=protected-access
     def __rshift__(self, other: Union[CircuitComponent, Circuit]) -> Circuit:
         r"""
         Returns a ``Circuit`` that contains all the components of ``self`` as well as
         ``other`` if ``other`` is a ``CircuitComponent``, or ``other.components`` if
         ``other`` is a ``Circuit``).
         """
-        if isinstance(other, CircuitComponent):
-            other = Circuit([other])
-        return Circuit(self.components + other.components)
+        others = [other] if isinstance(other, CircuitComponent) else other.components
+        # the components of ``self`` are already copies owned by a circuit, so only the new
+        # ones need to be copied
+        ret = Circuit()
+        ret._components = self.components + [c._light_copy() for c in others]
+        return ret
 
     # pylint: disable=too-many-branches,too-many-statements
     def __repr__(self) -> str:
@@ -646,6 +646,7 @@ class DM(State):
         )
         if representation is not None:
             self._representation = representation
+        self._purity_cache = None
 
     @classmethod
     def from_phase_space(
@@ -696,7 +697,12 @@ class DM(State):
 
     @property
     def purity(self) -> float:
-        return self.L2_norm
+        # the purity is stored along with the representation it was computed from, so that
+        # states whose representation is rebuilt from their parameters are not served stale values
+        representation = self.representation
+        if self._purity_cache is None or self._purity_cache[0] is not representation:
+            self._purity_cache = (representation, self.L2_norm)
+        return self._purity_cache[1]
 
     def expectation(self, operator: CircuitComponent):
         r"""
@@ -755,9 +761,10 @@ class DM(State):
         if not isinstance(result, CircuitComponent):
             return result  # scalar case handled here
 
-        w = result.wires
-        if not w.input and w.bra.modes == w.ket.modes:
-            return DM(w.modes, result.representation)
+        # read the modes of the wires directly rather than slicing them into new ``Wires``
+        out_bra, in_bra, out_ket, in_ket = result.wires.args
+        if not in_bra and not in_ket and out_bra == out_ket:
+            return DM(result.wires.modes, result.representation)
         return result
 
     def __getitem__(self, modes: Union[int, Sequence[int]]) -> State:
@@ -947,9 +954,11 @@ class Ket(State):
         if not isinstance(result, CircuitComponent):
             return result  # scalar case handled here
 
-        if not result.wires.input:
-            if not result.wires.bra:
+        # read the modes of the wires directly rather than slicing them into new ``Wires``
+        out_bra, in_bra, out_ket, in_ket = result.wires.args
+        if not in_bra and not in_ket:
+            if not out_bra:
                 return Ket(result.wires.modes, result.representation)
-            elif result.wires.bra.modes == result.wires.ket.modes:
+            elif out_bra == out_ket:
                 result = DM(result.wires.modes, result.representation)
         return result
@@ -364,11 +364,8 @@ class Vacuum(Ket):
         modes: Sequence[int],
     ) -> None:
         super().__init__(modes=modes, name="Vac")
-
-    @property
-    def representation(self) -> Bargmann:
-        n_modes = len(self.modes)
-        return Bargmann(*triples.vacuum_state_Abc(n_modes))
+        # the vacuum has no parameters, so its representation is built only once
+        self._representation = Bargmann(*triples.vacuum_state_Abc(len(modes)))
 
 
 #  ~~~~~~~~~~~~
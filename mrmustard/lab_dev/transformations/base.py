@@ -94,13 +94,13 @@ class Transformation(CircuitComponent):
 
         # compute the inverse
         A, b, _ = self.dual.representation.conj().triple  # apply X(.)X
-        almost_inverse = self._from_attributes(
-            Bargmann(math.inv(A[0]), -math.inv(A[0]) @ b[0], 1 + 0j), self.wires
-        )
+        A_inv = math.inv(A[0])
+        b_inv = -A_inv @ b[0]
+        almost_inverse = self._from_attributes(Bargmann(A_inv, b_inv, 1 + 0j), self.wires)
         almost_identity = self @ almost_inverse
         invert_this_c = almost_identity.representation.c
         actual_inverse = self._from_attributes(
-            Bargmann(math.inv(A[0]), -math.inv(A[0]) @ b[0], 1 / invert_this_c),
+            Bargmann(A_inv, b_inv, 1 / invert_this_c),
             self.wires,
             self.name + "_inv",
         )
@@ -23,7 +23,7 @@ from typing import Optional, Sequence, Tuple, Union
 from .base import Unitary, Channel
 from ...physics.representations import Bargmann
 from ...physics import triples
-from ..utils import make_parameter, reshape_params
+from ..utils import cache_if_constant, make_parameter, reshape_params
 
 __all__ = ["Attenuator", "BSgate", "Dgate", "Rgate", "Sgate", "Identity", "S2gate"]
 
@@ -105,6 +105,7 @@ class BSgate(Unitary):
         self._add_parameter(make_parameter(phi_trainable, phi, "phi", phi_bounds))
 
     @property
+    @cache_if_constant
     def representation(self) -> Bargmann:
         return Bargmann(*triples.beamsplitter_gate_Abc(self.theta.value, self.phi.value))
 
@@ -173,6 +174,7 @@ class Dgate(Unitary):
         self._add_parameter(make_parameter(y_trainable, y, "y", y_bounds))
 
     @property
+    @cache_if_constant
     def representation(self) -> Bargmann:
         n_modes = len(self.modes)
         xs, ys = list(reshape_params(n_modes, x=self.x.value, y=self.y.value))
@@ -214,6 +216,7 @@ class Rgate(Unitary):
         self._add_parameter(make_parameter(phi_trainable, phi, "phi", phi_bounds))
 
     @property
+    @cache_if_constant
     def representation(self) -> Bargmann:
         n_modes = len(self.modes)
         phis = list(reshape_params(n_modes, phi=self.phi.value))[0]
@@ -287,6 +290,7 @@ class Sgate(Unitary):
         self._add_parameter(make_parameter(phi_trainable, phi, "phi", phi_bounds))
 
     @property
+    @cache_if_constant
     def representation(self) -> Bargmann:
         n_modes = len(self.modes)
         rs, phis = list(reshape_params(n_modes, r=self.r.value, phi=self.phi.value))
@@ -318,11 +322,8 @@ class Identity(Unitary):
         modes: Sequence[int],
     ):
         super().__init__(modes_out=modes, modes_in=modes, name="Identity")
-
-    @property
-    def representation(self) -> Bargmann:
-        n_modes = len(self.modes)
-        return Bargmann(*triples.identity_Abc(n_modes))
+        # the identity has no parameters, so its representation is built only once
+        self._representation = Bargmann(*triples.identity_Abc(len(modes)))
 
 
 class S2gate(Unitary):
@@ -385,6 +386,7 @@ class S2gate(Unitary):
         self._add_parameter(make_parameter(phi_trainable, phi, "phi", phi_bounds))
 
     @property
+    @cache_if_constant
     def representation(self) -> Bargmann:
         return Bargmann(*triples.twomode_squeezing_gate_Abc(self.r.value, self.phi.value))
 
@@ -456,6 +458,7 @@ class Attenuator(Channel):
         )
 
     @property
+    @cache_if_constant
     def representation(self) -> Bargmann:
         n_modes = len(self.modes)
         eta = list(reshape_params(n_modes, eta=self.transmissivity.value))[0]
@@ -18,6 +18,7 @@
 This module contains the utility functions used by the classes in ``mrmustard.lab``.
 """
 
+from functools import wraps
 from typing import Callable, Generator, Optional, Tuple
 
 from mrmustard import math
@@ -48,6 +49,32 @@ def make_parameter(
     return Variable(value=value, name=name, bounds=bounds, update_fn=update_fn)
 
 
+def cache_if_constant(method: Callable) -> Callable:
+    r"""
+    Decorates a method without arguments (e.g. the getter of ``representation``) of a
+    circuit component so that its result is computed once and stored on the component,
+    as long as all the parameters of the component are constants.
+
+    Components with trainable parameters are recomputed at every call, as the values of
+    their variables can change and their gradients have to be tracked.
+
+    Args:
+        method: The method to decorate.
+    """
+    attr = f"_cached_{method.__name__}"
+
+    @wraps(method)
+    def wrapper(self):
+        if self.parameter_set.variables:
+            return method(self)
+        if (ret := self.__dict__.get(attr)) is None:
+            ret = method(self)
+            self.__dict__[attr] = ret
+        return ret
+
+    return wrapper
+
+
 def reshape_params(n_modes: str, **kwargs) -> Generator:
     r"""
     A utility function to turn the input parameters of states and gates into
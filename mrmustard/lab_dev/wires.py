@@ -188,7 +188,8 @@ class Wires:
         """
         if self.original:
             return self.original.id
-        return np.random.randint(0, 2**31)
+        # a plain ``int`` keeps the derived ``ids`` as plain ints, cheap to hash and add
+        return int(np.random.randint(0, 2**31))
 
     @cached_property
     def ids(self) -> list[int]:
@@ -206,7 +207,8 @@ class Wires:
             >>> assert ids == [id, id+1, id+2, id+3]
         """
         if self.original:
-            return [self.original.ids[i] for i in self.indices]
+            original_ids = self.original.ids
+            return [original_ids[i] for i in self.indices]
         return [id for d in self.ids_dicts for id in d.values()]
 
     @cached_property
@@ -237,10 +239,11 @@ class Wires:
         """
         if self.original:
             return self.original.index_dicts
-        return [
-            {m: i + sum(len(s) for s in self.args[:t]) for i, m in enumerate(lst)}
-            for t, lst in enumerate(self.sorted_args)
-        ]
+        ret, offset = [], 0
+        for lst in self.sorted_args:
+            ret.append({m: i for i, m in enumerate(lst, start=offset)})
+            offset += len(lst)
+        return ret
 
     @cached_property
     def ids_dicts(self) -> list[dict[int, int]]:
@@ -272,48 +275,64 @@ class Wires:
         r"The modes spanned by the wires."
         return set.union(*self.args)
 
+    def _subset(self, types: tuple[int, ...]) -> Wires:
+        r"""
+        New ``Wires`` object with only the wires of the given types (``0`` for ``output.bra``,
+        ``1`` for ``input.bra``, ``2`` for ``output.ket``, and ``3`` for ``input.ket``).
+
+        The subset shares the modes of this object, as well as their sorted order.
+        """
+        ret = Wires(*(self.args[t] if t in types else set() for t in (0, 1, 2, 3)))
+        ret._original = self.original or self  # pylint: disable=protected-access
+        sorted_args = self.sorted_args
+        ret.sorted_args = tuple(sorted_args[t] if t in types else [] for t in (0, 1, 2, 3))
+        return ret
+
     @cached_property
     def input(self) -> Wires:
         r"New ``Wires`` object without output wires."
-        ret = Wires(set(), self.args[1], set(), self.args[3])
-        ret._original = self.original or self  # pylint: disable=protected-access
-        return ret
+        return self._subset((1, 3))
 
     @cached_property
     def output(self) -> Wires:
         r"New ``Wires`` object without input wires."
-        ret = Wires(self.args[0], set(), self.args[2], set())
-        ret._original = self.original or self  # pylint: disable=protected-access
-        return ret
+        return self._subset((0, 2))
 
     @cached_property
     def ket(self) -> Wires:
         r"New ``Wires`` object without bra wires."
-        ret = Wires(set(), set(), self.args[2], self.args[3])
-        ret._original = self.original or self  # pylint: disable=protected-access
-        return ret
+        return self._subset((2, 3))
 
     @cached_property
     def bra(self) -> Wires:
         r"New ``Wires`` object without ket wires."
-        ret = Wires(self.args[0], self.args[1], set(), set())
-        ret._original = self.original or self  # pylint: disable=protected-access
+        return self._subset((0, 1))
+
+    def _permuted(self, perm: tuple[int, ...]) -> Wires:
+        r"""
+        New ``Wires`` object whose ``t``-type wires are the ``perm[t]``-type wires of this object.
+
+        The new object shares the modes of this object, as well as their sorted order.
+        """
+        ret = Wires(*(self.args[t] for t in perm))
+        sorted_args = self.sorted_args
+        ret.sorted_args = tuple(sorted_args[t] for t in perm)
         return ret
 
     @cached_property
     def adjoint(self) -> Wires:
         r"New ``Wires`` object obtained by swapping ket and bra wires."
-        return Wires(self.args[2], self.args[3], self.args[0], self.args[1])
+        return self._permuted((2, 3, 0, 1))
 
     @cached_property
     def dual(self) -> Wires:
         r"New ``Wires`` object obtained by swapping input and output wires."
-        return Wires(self.args[1], self.args[0], self.args[3], self.args[2])
+        return self._permuted((1, 0, 3, 2))
 
     def __getitem__(self, modes: tuple[int, ...] | int) -> Wires:
         r"New ``Wires`` object with wires only on the given modes."
-        modes_set = {modes} if isinstance(modes, int) else set(modes)
         if modes not in self._mode_cache:
+            modes_set = {modes} if isinstance(modes, int) else set(modes)
             w = Wires(*(self.args[t] & modes_set for t in (0, 1, 2, 3)))
             w._original = self.original or self
             self._mode_cache[modes] = w
@@ -402,10 +421,15 @@ class Wires:
 
         # calculate permutation
         result_ids = [id for d in w.ids_dicts for id in d.values()]
-        self_other_ids = [self.ids_dicts[t][m] for t in (0, 1, 2, 3) for m in sorted(sets[t])] + [
-            other.ids_dicts[t][m] for t in (0, 1, 2, 3) for m in sorted(sets[t + 4])
-        ]
-        perm = [self_other_ids.index(id) for id in result_ids]
+        # each set is a subset of the already sorted modes of self or other, so it is
+        # filtered in order rather than sorted again
+        self_sorted, other_sorted = self.sorted_args, other.sorted_args
+        self_ids, other_ids = self.ids_dicts, other.ids_dicts
+        self_other_ids = [
+            self_ids[t][m] for t in (0, 1, 2, 3) for m in self_sorted[t] if m in sets[t]
+        ] + [other_ids[t][m] for t in (0, 1, 2, 3) for m in other_sorted[t] if m in sets[t + 4]]
+        position = {id: i for i, id in enumerate(self_other_ids)}
+        perm = [position[id] for id in result_ids]
         return w, perm
 
     def __repr__(self) -> str:
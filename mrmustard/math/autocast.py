@@ -50,7 +50,10 @@ class Autocast:
 
     def cast_all(self, backend, *args, **kwargs):
         r"""Casts all arguments to the highest precision when possible and needed."""
-        max_dtype = self.max_dtype(self.get_dtypes(*args, **kwargs))
+        dtypes = self.get_dtypes(*args, **kwargs)
+        if len(set(dtypes)) <= 1:  # nothing to cast
+            return args, kwargs
+        max_dtype = self.max_dtype(dtypes)
         args = [
             backend.cast(arg, max_dtype) if self.should_cast(arg, max_dtype) else arg
             for arg in args
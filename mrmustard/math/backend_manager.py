@@ -16,6 +16,7 @@
 
 
 import importlib.util
+import string
 import sys
 from functools import lru_cache
 from itertools import product
@@ -426,7 +427,7 @@ class BackendManager:  # pylint: disable=too-many-public-methods, fixme
         Returns:
             The constraint function.
         """
-        return self._apply("constraint_func", (bounds))
+        return self._apply("constraint_func", (bounds,))
 
     def convolution(
         self,
@@ -1241,6 +1242,19 @@ class BackendManager:  # pylint: disable=too-many-public-methods, fixme
         """
         return self._apply("cholesky", (input,))
 
+    def cholesky_solve(self, chol: Tensor, rhs: Tensor) -> Tensor:
+        r"""The solution of the linear system :math:`Ax = b`, given the lower triangular
+        Cholesky factor :math:`L` of the positive-definite matrix :math:`A = LL^\dagger`.
+
+        Args:
+            chol: The Cholesky factor :math:`L`
+            rhs: The vector (or matrix) :math:`b`
+
+        Returns:
+            The solution :math:`x`
+        """
+        return self._apply("cholesky_solve", (chol, rhs))
+
     def Categorical(self, probs: Tensor, name: str):
         """Categorical distribution over integers.
 
@@ -1340,10 +1354,11 @@ class BackendManager:  # pylint: disable=too-many-public-methods, fixme
             W = unitary_group.rvs(dim=num_modes, random_state=settings.rng)
             V = unitary_group.rvs(dim=num_modes, random_state=settings.rng)
         r = settings.rng.uniform(low=0.0, high=max_r, size=num_modes)
-        OW = self.unitary_to_orthogonal(W)
-        OV = self.unitary_to_orthogonal(V)
-        dd = self.diag(self.concat([self.exp(-r), np.exp(r)], axis=0), k=0)
-        return OW @ dd @ OV
+        # the samples are numpy arrays, so the product is built in numpy and converted once
+        OW = np.block([[W.real, -W.imag], [W.imag, W.real]])
+        OV = np.block([[V.real, -V.imag], [V.imag, V.real]])
+        dd = np.concatenate([np.exp(-r), np.exp(r)])
+        return self.astensor((OW * dd) @ OV)
 
     @staticmethod
     def random_orthogonal(N: int) -> Tensor:
@@ -1495,6 +1510,12 @@ class BackendManager:  # pylint: disable=too-many-public-methods, fixme
     def all_diagonals(self, rho: Tensor, real: bool) -> Tensor:
         """Returns all the diagonals of a density matrix."""
         cutoffs = rho.shape[: rho.ndim // 2]
+        if self.backend_name == "numpy":
+            # read the diagonal in place, as reshaping a sliced density matrix would copy it
+            idx = string.ascii_letters[: len(cutoffs)]
+            diag = self.einsum(f"{idx}{idx}->{idx}", rho)
+            return self.real(diag) if real else diag
+
         rho = self.reshape(rho, (int(np.prod(cutoffs)), int(np.prod(cutoffs))))
         diag = self.diag_part(rho)
         if real:
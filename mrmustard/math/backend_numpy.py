@@ -267,7 +267,7 @@ class BackendNumpy(BackendBase):  # pragma: no cover
 
     @Autocast()
     def outer(self, array1: np.ndarray, array2: np.ndarray) -> np.ndarray:
-        return np.tensordot(array1, array2, [[], []])
+        return np.multiply.outer(array1, array2)
 
     def pad(
         self,
@@ -379,14 +379,19 @@ class BackendNumpy(BackendBase):  # pragma: no cover
     def cholesky(self, input: np.ndarray):
         return np.linalg.cholesky(input)
 
+    def cholesky_solve(self, chol: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+        return sp.linalg.cho_solve((chol, True), rhs)
+
     def Categorical(self, probs: np.ndarray, name: str):  # pylint: disable=unused-argument
         class Generator:
             def __init__(self, probs):
                 self._probs = probs
+                # the cdf is built once and reused by every draw
+                self._cdf = np.cumsum(probs)
 
             def sample(self):
-                idx = [i for i, _ in enumerate(probs)]
-                return np.random.choice(idx, p=probs / sum(probs))
+                u = np.random.random() * self._cdf[-1]
+                return min(int(np.searchsorted(self._cdf, u, side="right")), len(self._cdf) - 1)
 
         return Generator(probs)
 
@@ -464,9 +469,9 @@ class BackendNumpy(BackendBase):  # pragma: no cover
             from juliacall import Main as jl  # pylint: disable=import-outside-toplevel
 
             A, B, C = (
-                np.array(A).astype(np.complex128),
-                np.array(B).astype(np.complex128),
-                np.array(C).astype(np.complex128),
+                np.asarray(A, dtype=np.complex128),
+                np.asarray(B, dtype=np.complex128),
+                np.asarray(C, dtype=np.complex128),
             )
             G = jl.Vanilla.vanilla(A, B, C.item(), np.array(shape, dtype=np.int64), precision_bits)
 
@@ -70,11 +70,12 @@ class BackendTensorflow(BackendBase):  # pragma: no cover
         return tf.abs(array)
 
     def allclose(self, array1: np.array, array2: np.array, atol: float) -> bool:
-        array1 = self.astensor(array1)
-        array2 = self.astensor(array2)
+        # the comparison returns a plain bool, so it is done eagerly in numpy
+        array1 = self.asnumpy(array1)
+        array2 = self.asnumpy(array2)
         if array1.shape != array2.shape:
             raise ValueError("Cannot compare arrays of different shapes.")
-        return tf.experimental.numpy.allclose(array1, array2, atol=atol)
+        return np.allclose(array1, array2, atol=atol)
 
     def any(self, array: tf.Tensor) -> tf.Tensor:
         return tf.math.reduce_any(array)
@@ -140,18 +141,18 @@ class BackendTensorflow(BackendBase):  # pragma: no cover
     def constraint_func(
         self, bounds: Tuple[Optional[float], Optional[float]]
     ) -> Optional[Callable]:
-        bounds = (
-            -np.inf if bounds[0] is None else bounds[0],
-            np.inf if bounds[1] is None else bounds[1],
-        )
-        if bounds != (-np.inf, np.inf):
-
-            def constraint(x):
-                return tf.clip_by_value(x, bounds[0], bounds[1])
-
-        else:
-            constraint = None
-        return constraint
+        lower, upper = bounds
+        lower = None if lower is None or lower == -np.inf else lower
+        upper = None if upper is None or upper == np.inf else upper
+
+        # the bounds are fixed, so we pick the cheapest constraint once here
+        if lower is None and upper is None:
+            return None
+        if upper is None:
+            return lambda x: tf.maximum(x, lower)
+        if lower is None:
+            return lambda x: tf.minimum(x, upper)
+        return lambda x: tf.clip_by_value(x, lower, upper)
 
     # pylint: disable=arguments-differ
     @Autocast()
@@ -374,6 +375,12 @@ class BackendTensorflow(BackendBase):  # pragma: no cover
     def cholesky(self, input: Tensor):
         return tf.linalg.cholesky(input)
 
+    def cholesky_solve(self, chol: tf.Tensor, rhs: tf.Tensor) -> tf.Tensor:
+        if len(rhs.shape) == len(chol.shape) - 1:
+            rhs = tf.expand_dims(rhs, -1)
+            return tf.linalg.cholesky_solve(chol, rhs)[..., 0]
+        return tf.linalg.cholesky_solve(chol, rhs)
+
     def Categorical(self, probs: Tensor, name: str):
         return tfp.distributions.Categorical(probs=probs, name=name)
 
@@ -430,7 +437,9 @@ class BackendTensorflow(BackendBase):  # pragma: no cover
         Returns:
             tuple(Tensor, List[Tensor]): the loss and the gradients
         """
-        with tf.GradientTape() as tape:
+        # only the parameters being optimized are recorded on the tape
+        with tf.GradientTape(watch_accessed_variables=False) as tape:
+            tape.watch(parameters)
             loss = cost_fn()
         gradients = tape.gradient(loss, parameters)
         return loss, gradients
@@ -452,6 +461,11 @@ class BackendTensorflow(BackendBase):  # pragma: no cover
 
         Returns:
             The renormalized Hermite polynomial of given shape.
+
+        .. note::
+
+            The recursion (and its vjp) runs on the host, so ``A``, ``B`` and ``C`` are copied
+            to the host only once here and the gradient reuses the host copies.
         """
 
         precision_bits = settings.PRECISION_BITS_HERMITE_POLY
@@ -465,9 +479,9 @@ class BackendTensorflow(BackendBase):  # pragma: no cover
             from juliacall import Main as jl  # pylint: disable=import-outside-toplevel
 
             A, B, C = (
-                A.astype(np.complex128),
-                B.astype(np.complex128),
-                C.astype(np.complex128),
+                A.astype(np.complex128, copy=False),
+                B.astype(np.complex128, copy=False),
+                C.astype(np.complex128, copy=False),
             )
 
             G = self.astensor(
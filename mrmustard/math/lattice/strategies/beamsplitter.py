@@ -30,7 +30,7 @@ from mrmustard.utils.typing import ComplexMatrix, ComplexTensor, ComplexVector
 
 SQRT = np.sqrt(np.arange(100000))
 
-__all__ = ["beamsplitter", "beamsplitter_vjp", "beamsplitter_schwinger"]
+__all__ = ["beamsplitter", "beamsplitter_vjp", "beamsplitter_schwinger", "apply_twomode_gate"]
 
 
 @njit
@@ -202,3 +202,39 @@ def beamsplitter_schwinger(shape, theta, phi, max_N=None):
             for j in range(max(0, N + 1 - c1), min(N + 1, c2)):
                 U[N - i, i, N - j, j] = block[i, j]
     return U
+
+
+@njit
+def apply_twomode_gate(
+    U: ComplexTensor, psi: ComplexTensor, conserve_difference: bool = False
+) -> ComplexTensor:  # pragma: no cover
+    r"""Applies a two-mode gate that conserves either the total photon number (like the
+    beamsplitter, ``k+l=m+n``) or the photon number difference (like the two-mode squeezer,
+    ``k-l=m-n``) to a batch of two-mode tensors.
+
+    Because of the selection rule, one of the summation indices is fixed by the other three,
+    so the contraction costs one loop less than a generic two-mode contraction.
+
+    Args:
+        U (np.ndarray): the Fock representation of the gate, with shape ``(K, L, M, N)`` in the
+            order ``(out_0, out_1, in_0, in_1)``
+        psi (np.ndarray): the tensor the gate is applied to, with shape ``(R, M, N)`` where ``R``
+            is a batch dimension (e.g. all the other modes of a state)
+        conserve_difference (bool): whether the gate conserves the photon number difference
+            rather than the total photon number
+
+    Returns:
+        np.ndarray: the tensor of shape ``(R, K, L)`` after the gate is applied
+    """
+    K, L, M, N = U.shape
+    R = psi.shape[0]
+    out = np.zeros((R, K, L), dtype=np.complex128)
+    for k in range(K):
+        for l in range(L):
+            for m in range(M):
+                n = m - k + l if conserve_difference else k + l - m
+                if 0 <= n < N:
+                    u = U[k, l, m, n]
+                    for r in range(R):
+                        out[r, k, l] += u * psi[r, m, n]
+    return out
@@ -22,7 +22,7 @@ from .flat_indices import first_available_pivot, lower_neighbors, shape_to_strid
 __all__ = ["vanilla", "vanilla_batch", "vanilla_jacobian", "vanilla_vjp"]
 
 
-@njit
+@njit(cache=True)
 def vanilla(shape: tuple[int, ...], A, b, c) -> ComplexTensor:  # pragma: no cover
     r"""Vanilla Fock-Bargmann strategy.
 
@@ -42,7 +42,7 @@ def vanilla(shape: tuple[int, ...], A, b, c) -> ComplexTensor:  # pragma: no cov
     strides = shape_to_strides(np.array(shape))
 
     # init flat output tensor
-    ret = np.array([0 + 0j] * np.prod(np.array(shape)))
+    ret = np.zeros(np.prod(np.array(shape)), dtype=np.complex128)
 
     # initialize the indeces.
     # ``index`` is the index of the flattened output tensor, while
@@ -135,7 +135,7 @@ def vanilla_jacobian(
     return dGdA, dGdb, dGdc
 
 
-@njit
+@njit(cache=True)
 def vanilla_vjp(G, c, dLdG) -> tuple[ComplexMatrix, ComplexVector, complex]:  # pragma: no cover
     r"""Vanilla Fock-Bargmann strategy gradient. Returns dL/dA, dL/db, dL/dc.
 
@@ -152,8 +152,9 @@ def vanilla_vjp(G, c, dLdG) -> tuple[ComplexMatrix, ComplexVector, complex]:  #
     # calculate the strides
     strides = shape_to_strides(np.array(shape))
 
-    # linearize G
-    G_lin = G.flatten()
+    # linearize G and dLdG (without copying them if they are contiguous already)
+    G_lin = np.ascontiguousarray(G).reshape(-1)
+    dLdG_lin = np.ascontiguousarray(dLdG).reshape(-1)
 
     # init gradients
     D = G.ndim
@@ -170,6 +171,9 @@ def vanilla_vjp(G, c, dLdG) -> tuple[ComplexMatrix, ComplexVector, complex]:  #
     index_u_iter = np.ndindex(shape)
     next(index_u_iter)
 
+    # accumulates sum(G * dLdG) for dL/dc
+    GdLdG = G_lin[0] * dLdG_lin[0]
+
     for index_u in index_u_iter:
         index += 1
 
@@ -182,9 +186,10 @@ def vanilla_vjp(G, c, dLdG) -> tuple[ComplexMatrix, ComplexVector, complex]:  #
             for j in range(i + 1, len(db)):
                 dA[i, j] = np.sqrt(index_u[i] * index_u[j]) * G_lin[n - strides[j]]
 
-        dLdA += dA * dLdG[index_u]
-        dLdb += db * dLdG[index_u]
+        dLdA += dA * dLdG_lin[index]
+        dLdb += db * dLdG_lin[index]
+        GdLdG += G_lin[index] * dLdG_lin[index]
 
-    dLdc = np.sum(G_lin.reshape(shape) * dLdG) / c
+    dLdc = GdLdG / c
 
     return dLdA, dLdb, dLdc
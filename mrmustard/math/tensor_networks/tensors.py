@@ -192,17 +192,14 @@ class Tensor(ABC):
         self._modes_out_bra = modes_out_bra if modes_out_bra else []
 
         # initialize ket and bra wire dicts
-        self._input = WireGroup()
-        for mode in self._modes_in_ket:
-            self._input.ket |= {mode: Wire(random_int(), mode, True, True)}
-        for mode in self._modes_in_bra:
-            self._input.bra |= {mode: Wire(random_int(), mode, True, False)}
-
-        self._output = WireGroup()
-        for mode in self._modes_out_ket:
-            self._output.ket |= {mode: Wire(random_int(), mode, False, True)}
-        for mode in self._modes_out_bra:
-            self._output.bra |= {mode: Wire(random_int(), mode, False, False)}
+        self._input = WireGroup(
+            ket={mode: Wire(random_int(), mode, True, True) for mode in self._modes_in_ket},
+            bra={mode: Wire(random_int(), mode, True, False) for mode in self._modes_in_bra},
+        )
+        self._output = WireGroup(
+            ket={mode: Wire(random_int(), mode, False, True) for mode in self._modes_out_ket},
+            bra={mode: Wire(random_int(), mode, False, False) for mode in self._modes_out_bra},
+        )
 
     @property
     def adjoint(self) -> AdjointView:
@@ -222,12 +219,13 @@ class Tensor(ABC):
         For backward compatibility. Don't overuse.
         It returns a list of modes for this Tensor, unless it's ambiguous.
         """
-        if self.modes_in == self.modes_out:  # transformation on same modes
-            return list(self.modes_in)
-        elif len(self.modes_in) == 0:  # state
-            return list(self.modes_out)
-        elif len(self.modes_out) == 0:  # measurement
-            return list(self.modes_in)
+        modes_in, modes_out = self.modes_in, self.modes_out
+        if modes_in == modes_out:  # transformation on same modes
+            return list(modes_in)
+        elif not modes_in:  # state
+            return list(modes_out)
+        elif not modes_out:  # measurement
+            return list(modes_in)
         else:
             raise ValueError("modes are ambiguous for this Tensor.")
 
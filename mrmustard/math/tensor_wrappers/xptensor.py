@@ -284,9 +284,12 @@ class XPTensor(ABC):
                 self.outmodes,
                 other.inmodes,
             )
-        contracted = [i for i in self.inmodes if i in other.outmodes]
-        uncontracted_self = [i for i in self.inmodes if i not in contracted]
-        uncontracted_other = [o for o in other.outmodes if o not in contracted]
+        # positions of the modes along the contracted axes
+        self_in = {m: i for i, m in enumerate(self.inmodes)}
+        other_out = {m: i for i, m in enumerate(other.outmodes)}
+        contracted = [i for i in self.inmodes if i in other_out]
+        uncontracted_self = [i for i in self.inmodes if i not in other_out]
+        uncontracted_other = [o for o in other.outmodes if o not in self_in]
         if not (
             set(self.outmodes).isdisjoint(uncontracted_other)
             and set(other.inmodes).isdisjoint(uncontracted_self)
@@ -296,12 +299,8 @@ class XPTensor(ABC):
         copied_rows = None
         copied_cols = None
         if len(contracted) > 0:
-            subtensor1 = math.gather(
-                self.tensor, [self.inmodes.index(m) for m in contracted], axis=1
-            )
-            subtensor2 = math.gather(
-                other.tensor, [other.outmodes.index(m) for m in contracted], axis=0
-            )
+            subtensor1 = math.gather(self.tensor, [self_in[m] for m in contracted], axis=1)
+            subtensor2 = math.gather(other.tensor, [other_out[m] for m in contracted], axis=0)
             if other.isMatrix:
                 bulk = math.tensordot(subtensor1, subtensor2, ((1, 3), (0, 2)))
                 bulk = math.transpose(bulk, (0, 2, 1, 3))
@@ -309,12 +308,10 @@ class XPTensor(ABC):
                 bulk = math.tensordot(subtensor1, subtensor2, ((1, 3), (0, 1)))
         if self.like_1 and len(uncontracted_other) > 0:
             copied_rows = math.gather(
-                other.tensor, [other.outmodes.index(m) for m in uncontracted_other], axis=0
+                other.tensor, [other_out[m] for m in uncontracted_other], axis=0
             )
         if other.like_1 and len(uncontracted_self) > 0:
-            copied_cols = math.gather(
-                self.tensor, [self.inmodes.index(m) for m in uncontracted_self], axis=1
-            )
+            copied_cols = math.gather(self.tensor, [self_in[m] for m in uncontracted_self], axis=1)
         if copied_rows is not None and copied_cols is not None:
             if bulk is None:
                 bulk = math.zeros(
@@ -341,18 +338,25 @@ class XPTensor(ABC):
         if other.like_0 and len(contracted) == 0:
             outmodes = uncontracted_other
         if self.like_0:
-            outmodes = [m for m in outmodes if m in self.outmodes]
+            self_out = set(self.outmodes)
+            outmodes = [m for m in outmodes if m in self_out]
 
         inmodes = uncontracted_self + other.inmodes
         if self.like_0 and len(contracted) == 0:
             inmodes = uncontracted_self
         if other.like_0:
-            inmodes = [m for m in inmodes if m in other.inmodes]
+            other_in = set(other.inmodes)
+            inmodes = [m for m in inmodes if m in other_in]
 
         if final is not None:
-            final = math.gather(final, [outmodes.index(o) for o in sorted(outmodes)], axis=0)
+            # the modes are unique, so sorting them is the same as argsorting the positions
+            final = math.gather(
+                final, sorted(range(len(outmodes)), key=outmodes.__getitem__), axis=0
+            )
             if other.isMatrix:
-                final = math.gather(final, [inmodes.index(i) for i in sorted(inmodes)], axis=1)
+                final = math.gather(
+                    final, sorted(range(len(inmodes)), key=inmodes.__getitem__), axis=1
+                )
         return final, (sorted(outmodes), sorted(inmodes))
 
     def _mode_aware_vecvec(self, other: XPVector) -> Scalar:
@@ -146,25 +146,40 @@ class PolyExpBase(Ansatz):
         self.num_vars = self.mat.shape[-1]
         self._simplified = False
 
+    @classmethod
+    def _unchecked(cls, mat: Batch[Matrix], vec: Batch[Vector], array: Batch[Tensor]):
+        r"""
+        Builds an object from data that are already batched tensors, e.g. the result of
+        operations between objects, skipping the conversions done by ``__init__``.
+        """
+        ret = cls.__new__(cls)
+        ret.mat = mat
+        ret.vec = vec
+        ret.array = array
+        ret.batch_size = mat.shape[0]
+        ret.num_vars = mat.shape[-1]
+        ret._simplified = False
+        return ret
+
     def __neg__(self) -> PolyExpBase:
-        return self.__class__(self.mat, self.vec, -self.array)
+        return self._unchecked(self.mat, self.vec, -self.array)
 
     def __eq__(self, other: PolyExpBase) -> bool:
-        return self._equal_no_array(other) and np.allclose(self.array, other.array, atol=1e-10)
+        if self is other:
+            return True
+        return self._equal_no_array(other) and _close(self.array, other.array)
 
     def _equal_no_array(self, other: PolyExpBase) -> bool:
         self.simplify()
         other.simplify()
-        return np.allclose(self.vec, other.vec, atol=1e-10) and np.allclose(
-            self.mat, other.mat, atol=1e-10
-        )
+        return _close(self.vec, other.vec) and _close(self.mat, other.mat)
 
     def __add__(self, other: PolyExpBase) -> PolyExpBase:
         combined_matrices = math.concat([self.mat, other.mat], axis=0)
         combined_vectors = math.concat([self.vec, other.vec], axis=0)
         combined_arrays = math.concat([self.array, other.array], axis=0)
         # note output is not simplified
-        return self.__class__(combined_matrices, combined_vectors, combined_arrays)
+        return self._unchecked(combined_matrices, combined_vectors, combined_arrays)
 
     @property
     def degree(self) -> int:
@@ -181,20 +196,41 @@ class PolyExpBase(Ansatz):
         exponential part, i.e. two terms along the batch are considered equal if their
         matrix and vector are equal. In this case only one is kept and the arrays are added.
 
+        Identical terms are found by hashing in a single pass over the batch, and each of the
+        remaining distinct terms is then compared with ``np.allclose`` to those that follow it.
+
         Does not run if the representation has already been simplified, so it is safe to call.
         """
         if self._simplified:
             return
-        indices_to_check = set(range(self.batch_size))
-        removed = []
-        while indices_to_check:
-            i = indices_to_check.pop()
-            for j in indices_to_check.copy():
-                if np.allclose(self.mat[i], self.mat[j]) and np.allclose(self.vec[i], self.vec[j]):
-                    self.array = math.update_add_tensor(self.array, [[i]], [self.array[j]])
-                    indices_to_check.remove(j)
-                    removed.append(j)
-        to_keep = [i for i in range(self.batch_size) if i not in removed]
+        terms = np.concatenate(
+            [
+                math.asnumpy(self.mat).reshape(self.batch_size, -1),
+                math.asnumpy(self.vec).reshape(self.batch_size, -1),
+            ],
+            axis=1,
+        )
+        first = {}
+        owner = np.array([first.setdefault(t.tobytes(), i) for i, t in enumerate(terms)])
+        # terms that are not identical may still be within the tolerance of ``np.allclose``
+        reps = np.flatnonzero(owner == np.arange(self.batch_size))
+        rep_terms = terms[reps]
+        absorbed = np.zeros(len(reps), dtype=bool)
+        for a, i in enumerate(reps):
+            if absorbed[a]:
+                continue
+            rest = rep_terms[a + 1 :]
+            close = np.all(np.abs(rep_terms[a] - rest) <= 1e-8 + 1e-5 * np.abs(rest), axis=-1)
+            merge = close & ~absorbed[a + 1 :]
+            absorbed[a + 1 :] |= merge
+            owner[np.isin(owner, reps[a + 1 :][merge])] = i
+        to_keep = reps[~absorbed].tolist()
+        # the arrays of the terms to combine are added together in a single update
+        removed = np.flatnonzero(owner != np.arange(self.batch_size)).tolist()
+        if removed:
+            self.array = math.update_add_tensor(
+                self.array, [[j] for j in owner[removed]], math.gather(self.array, removed, axis=0)
+            )
         self.mat = math.gather(self.mat, to_keep, axis=0)
         self.vec = math.gather(self.vec, to_keep, axis=0)
         self.array = math.gather(self.array, to_keep, axis=0)
@@ -208,14 +244,20 @@ class PolyExpBase(Ansatz):
             return
         self._order_batch()
         to_keep = [d0 := 0]
+        targets, removed = [], []
         mat, vec = self.mat[d0], self.vec[d0]
         for d in range(1, self.batch_size):
             if np.allclose(mat, self.mat[d]) and np.allclose(vec, self.vec[d]):
-                self.array = math.update_add_tensor(self.array, [[d0]], [self.array[d]])
+                targets.append([d0])
+                removed.append(d)
             else:
                 to_keep.append(d)
                 d0 = d
                 mat, vec = self.mat[d0], self.vec[d0]
+        if removed:
+            self.array = math.update_add_tensor(
+                self.array, targets, math.gather(self.array, removed, axis=0)
+            )
         self.mat = math.gather(self.mat, to_keep, axis=0)
         self.vec = math.gather(self.vec, to_keep, axis=0)
         self.array = math.gather(self.array, to_keep, axis=0)
@@ -292,6 +334,16 @@ class PolyExpAnsatz(PolyExpBase):
         c = math.astensor(c)
         super().__init__(mat=A, vec=b, array=c)
 
+    @classmethod
+    def _unchecked(cls, A: Batch[Matrix], b: Batch[Vector], c: Batch[Tensor]) -> PolyExpAnsatz:
+        r"""
+        Builds an ansatz from triples that are already batched tensors, e.g. the result of
+        operations between ansatze, skipping the conversions done by ``__init__``.
+        """
+        ansatz = super()._unchecked(A, b, c)
+        ansatz.name = ""
+        return ansatz
+
     @property
     def A(self) -> Batch[ComplexMatrix]:
         r"""
@@ -347,10 +399,10 @@ class PolyExpAnsatz(PolyExpBase):
             PolyExpAnsatz: The product of this ansatz and other.
         """
         if isinstance(other, PolyExpAnsatz):
-            new_a = [A1 + A2 for A1, A2 in itertools.product(self.A, other.A)]
-            new_b = [b1 + b2 for b1, b2 in itertools.product(self.b, other.b)]
-            new_c = [c1 * c2 for c1, c2 in itertools.product(self.c, other.c)]
-            return self.__class__(A=new_a, b=new_b, c=new_c)
+            new_a = _batch_product(self.A, other.A, lambda x, y: x + y)
+            new_b = _batch_product(self.b, other.b, lambda x, y: x + y)
+            new_c = _batch_product(self.c, other.c, lambda x, y: x * y)
+            return self._unchecked(new_a, new_b, new_c)
         else:
             try:
                 return self.__class__(self.A, self.b, self.c * other)
@@ -370,10 +422,10 @@ class PolyExpAnsatz(PolyExpBase):
             PolyExpAnsatz: The division of this ansatz by other.
         """
         if isinstance(other, PolyExpAnsatz):
-            new_a = [A1 - A2 for A1, A2 in itertools.product(self.A, other.A)]
-            new_b = [b1 - b2 for b1, b2 in itertools.product(self.b, other.b)]
-            new_c = [c1 / c2 for c1, c2 in itertools.product(self.c, other.c)]
-            return self.__class__(A=new_a, b=new_b, c=new_c)
+            new_a = _batch_product(self.A, other.A, lambda x, y: x - y)
+            new_b = _batch_product(self.b, other.b, lambda x, y: x - y)
+            new_c = _batch_product(self.c, other.c, lambda x, y: x / y)
+            return self._unchecked(new_a, new_b, new_c)
         else:
             try:
                 return self.__class__(self.A, self.b, self.c / other)
@@ -393,10 +445,22 @@ class PolyExpAnsatz(PolyExpBase):
         Returns:
             The tensor product of this ansatz and other.
         """
-        As = [math.block_diag(a1, a2) for a1 in self.A for a2 in other.A]
-        bs = [math.concat([b1, b2], axis=-1) for b1 in self.b for b2 in other.b]
-        cs = [math.outer(c1, c2) for c1 in self.c for c2 in other.c]
-        return self.__class__(As, bs, cs)
+        n1, n2 = self.num_vars, other.num_vars
+        # once padded with zeros, the matrices (vectors) of each pair add up to their
+        # block-diagonal matrix (concatenated vector)
+        A1 = math.pad(self.A, ((0, 0), (0, n2), (0, n2)))
+        A2 = math.pad(other.A, ((0, 0), (n1, 0), (n1, 0)))
+        b1 = math.pad(self.b, ((0, 0), (0, n2)))
+        b2 = math.pad(other.b, ((0, 0), (n1, 0)))
+        # and the arrays of each pair multiply to their outer product
+        shape1, shape2 = tuple(self.c.shape[1:]), tuple(other.c.shape[1:])
+        c1 = math.reshape(self.c, (-1,) + shape1 + (1,) * len(shape2))
+        c2 = math.reshape(other.c, (-1,) + (1,) * len(shape1) + shape2)
+        return self._unchecked(
+            _batch_product(A1, A2, lambda x, y: x + y),
+            _batch_product(b1, b2, lambda x, y: x + y),
+            _batch_product(c1, c2, lambda x, y: x * y),
+        )
 
 
 class ArrayAnsatz(Ansatz):
@@ -435,6 +499,8 @@ class ArrayAnsatz(Ansatz):
         Raises:
             ValueError: If the arrays don't have the same shape.
         """
+        if self.array is other.array:
+            return True
         try:
             return np.allclose(self.array, other.array)
         except Exception as e:
@@ -530,6 +596,25 @@ class ArrayAnsatz(Ansatz):
         return self.__class__(math.conj(self.array))
 
 
+def _batch_product(x: Tensor, y: Tensor, op) -> Tensor:
+    r"""
+    Applies the element-wise ``op`` to every pair of elements of the batches ``x`` and ``y``
+    in a single broadcast operation.
+
+    The pairs are ordered as in ``itertools.product(x, y)``.
+
+    Args:
+        x: A batched tensor.
+        y: Another batched tensor.
+        op: The element-wise binary operation.
+
+    Returns:
+        The batched tensor of shape ``(len(x) * len(y), ...)``.
+    """
+    result = op(math.expand_dims(x, 1), math.expand_dims(y, 0))
+    return math.reshape(result, (-1,) + tuple(result.shape[2:]))
+
+
 def bargmann_Abc_to_phasespace_cov_means(
     A: Matrix, b: Vector, c: Scalar
 ) -> tuple[Matrix, Vector, Scalar]:
@@ -566,3 +651,11 @@ def bargmann_Abc_to_phasespace_cov_means(
         for bvec in b
     ]
     return math.astensor(cov), math.astensor(mean), coeff
+
+
+def _close(x: Tensor, y: Tensor) -> bool:
+    r"""
+    Whether ``x`` and ``y`` are equal up to an absolute tolerance of ``1e-10``,
+    skipping the element-wise scan when both are the same tensor.
+    """
+    return x is y or np.allclose(x, y, atol=1e-10)
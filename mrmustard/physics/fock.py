@@ -18,6 +18,7 @@
 This module contains functions for performing calculations on objects in the Fock representations.
 """
 
+import string
 from functools import lru_cache
 from typing import List, Optional, Sequence, Tuple, Union
 
@@ -91,18 +92,20 @@ def autocutoffs(cov: Matrix, means: Vector, probability: float):
         Tuple[int, ...]: the suggested cutoffs
     """
     M = len(means) // 2
+    # the cutoffs are plain integers, so the marginals are sliced from numpy copies
+    cov, means = math.asnumpy(cov), math.asnumpy(means)
     cutoffs = []
     for i in range(M):
-        cov_i = np.array([[cov[i, i], cov[i, i + M]], [cov[i + M, i], cov[i + M, i + M]]])
-        means_i = np.array([means[i], means[i + M]])
+        idx = [i, i + M]
+        cov_i = cov[np.ix_(idx, idx)]
+        means_i = means[idx]
         # apply 1-d recursion until probability is less than 0.99
         A, B, C = [math.asnumpy(x) for x in wigner_to_bargmann_rho(cov_i, means_i)]
         diag = math.hermite_renormalized_diagonal(A, B, C, cutoffs=[100])
         # find at what index in the cumsum the probability is more than 0.99
-        for i, val in enumerate(np.cumsum(diag)):
-            if val > probability:
-                cutoffs.append(max(i + 1, settings.AUTOCUTOFF_MIN_CUTOFF))
-                break
+        (above,) = np.nonzero(np.cumsum(math.asnumpy(diag)) > probability)
+        if above.size:
+            cutoffs.append(max(int(above[0]) + 1, settings.AUTOCUTOFF_MIN_CUTOFF))
         else:
             cutoffs.append(settings.AUTOCUTOFF_MAX_CUTOFF)
     return cutoffs
@@ -250,7 +253,8 @@ def ket_to_probs(ket: Tensor) -> Tensor:
     Returns:
         Tensor: the probabilities vector
     """
-    return math.abs(ket) ** 2
+    # cheaper than ``math.abs(ket) ** 2``, which takes a square root only to square it
+    return math.real(ket) ** 2 + math.imag(ket) ** 2
 
 
 def dm_to_probs(dm: Tensor) -> Tensor:
@@ -338,7 +342,7 @@ def fidelity(state_a, state_b, a_ket: bool, b_ket: bool) -> Scalar:
 
 def number_means(tensor, is_dm: bool):
     r"""Returns the mean of the number operator in each mode."""
-    probs = math.all_diagonals(tensor, real=True) if is_dm else math.abs(tensor) ** 2
+    probs = math.all_diagonals(tensor, real=True) if is_dm else ket_to_probs(tensor)
     modes = list(range(len(probs.shape)))
     marginals = [math.sum(probs, axes=modes[:k] + modes[k + 1 :]) for k in range(len(modes))]
     return math.astensor(
@@ -351,7 +355,7 @@ def number_means(tensor, is_dm: bool):
 
 def number_variances(tensor, is_dm: bool):
     r"""Returns the variance of the number operator in each mode."""
-    probs = math.all_diagonals(tensor, real=True) if is_dm else math.abs(tensor) ** 2
+    probs = math.all_diagonals(tensor, real=True) if is_dm else ket_to_probs(tensor)
     modes = list(range(len(probs.shape)))
     marginals = [math.sum(probs, axes=modes[:k] + modes[k + 1 :]) for k in range(len(modes))]
     return math.astensor(
@@ -484,6 +488,100 @@ def apply_kraus_to_dm(kraus, dm, kraus_in_modes, kraus_out_modes=None):
     return k_dm_k.transpose(left + right).tensor
 
 
+def apply_twomode_gate_to_ket(U, ket, modes, conserve_difference=False):
+    r"""Applies a two-mode gate with a photon number selection rule to a ket.
+
+    This is a faster alternative to :func:`apply_kraus_to_ket` for gates that conserve the total
+    photon number (like the beamsplitter) or the photon number difference (like the two-mode
+    squeezer). It only supports numpy arrays, as it does not propagate gradients.
+
+    Args:
+        U (array): the gate with indices ``(out_0, out_1, in_0, in_1)``
+        ket (array): the ket to which the gate is applied
+        modes (list of ints): the two indices (counting from 0) of the ket the gate acts on
+        conserve_difference (bool): whether the gate conserves the photon number difference
+            rather than the total photon number
+
+    Returns:
+        array: the resulting ket
+    """
+    rest = [i for i in range(ket.ndim) if i not in modes]
+    psi = np.transpose(ket, rest + list(modes))
+    rest_shape = psi.shape[:-2]
+    psi = np.ascontiguousarray(psi.reshape((-1,) + psi.shape[-2:]), dtype=np.complex128)
+    out = strategies.apply_twomode_gate(
+        np.asarray(U, dtype=np.complex128), psi, conserve_difference
+    )
+    out = out.reshape(rest_shape + out.shape[-2:])
+    return np.transpose(out, np.argsort(rest + list(modes)))
+
+
+def apply_twomode_gate_to_dm(U, dm, modes, conserve_difference=False):
+    r"""Applies a two-mode gate with a photon number selection rule to a density matrix.
+
+    See :func:`apply_twomode_gate_to_ket` for details.
+
+    Args:
+        U (array): the gate with indices ``(out_0, out_1, in_0, in_1)``
+        dm (array): the density matrix to which the gate is applied
+        modes (list of ints): the two indices (counting from 0) of the density matrix the gate acts on
+        conserve_difference (bool): whether the gate conserves the photon number difference
+            rather than the total photon number
+
+    Returns:
+        array: the resulting density matrix
+    """
+    N = dm.ndim // 2
+    dm = apply_twomode_gate_to_ket(U, dm, modes, conserve_difference)
+    return apply_twomode_gate_to_ket(np.conj(U), dm, [m + N for m in modes], conserve_difference)
+
+
+def apply_diagonal_gate_to_ket(diag, ket, modes):
+    r"""Applies a gate that is diagonal in the Fock basis to a ket.
+
+    This is a faster alternative to :func:`apply_kraus_to_ket` for gates like the rotation gate:
+    instead of contracting the ket with the whole gate, each amplitude is multiplied by the
+    corresponding entry of the diagonal.
+
+    Args:
+        diag (array): the diagonal of the gate, with one index per mode it acts on
+        ket (array): the ket to which the gate is applied
+        modes (list of ints): the indices (counting from 0) of the ket the gate acts on
+
+    Returns:
+        array: the resulting ket
+    """
+    return ket * _broadcast_diagonal(diag, modes, ket.ndim)
+
+
+def apply_diagonal_gate_to_dm(diag, dm, modes):
+    r"""Applies a gate that is diagonal in the Fock basis to a density matrix.
+
+    See :func:`apply_diagonal_gate_to_ket` for details.
+
+    Args:
+        diag (array): the diagonal of the gate, with one index per mode it acts on
+        dm (array): the density matrix to which the gate is applied
+        modes (list of ints): the indices (counting from 0) of the density matrix the gate acts on
+
+    Returns:
+        array: the resulting density matrix
+    """
+    N = dm.ndim // 2
+    left = _broadcast_diagonal(diag, modes, dm.ndim)
+    right = _broadcast_diagonal(math.conj(diag), [m + N for m in modes], dm.ndim)
+    return dm * left * right
+
+
+def _broadcast_diagonal(diag, modes, ndim):
+    r"""Reshapes the diagonal of a gate acting on ``modes`` so that it broadcasts against a
+    tensor with ``ndim`` indices."""
+    shape = [1] * ndim
+    for i, m in enumerate(modes):
+        shape[m] = diag.shape[i]
+    return math.reshape(math.transpose(diag, np.argsort(modes)), shape)
+
+
 def apply_choi_to_dm(
     choi: ComplexTensor,
     dm: ComplexTensor,
@@ -605,6 +703,12 @@ def contract_states(
         Tensor: the contracted state tensor (subsystem of ``A``). Either ket or dm.
     """
 
+    if math.backend_name == "numpy" and (a_is_dm or not b_is_dm):
+        out = _contract_states_numpy(stateA, stateB, a_is_dm, b_is_dm, tuple(modes))
+        if not normalize:
+            return out
+        return out / (math.sum(math.all_diagonals(out, real=False)) if a_is_dm else math.norm(out))
+
     if a_is_dm:
         if b_is_dm:  # a DM, b DM
             dm = apply_choi_to_dm(choi=stateB, dm=stateA, choi_in_modes=modes, choi_out_modes=[])
@@ -637,6 +741,35 @@ def contract_states(
         return ket / math.norm(ket) if normalize else ket
 
 
+def _contract_states_numpy(stateA, stateB, a_is_dm: bool, b_is_dm: bool, modes: Tuple[int, ...]):
+    r"""Contracts ``stateB`` into the modes ``modes`` of ``stateA`` with plain matrix products.
+
+    Numpy-only counterpart of :func:`contract_states` for the cases where ``stateA`` is a
+    density matrix or both states are kets. The contracted modes of ``stateA`` are moved to the
+    front and flattened, so that the whole contraction is carried out by BLAS instead of going
+    through the axis-label bookkeeping of ``MMTensor``.
+    """
+    n = stateA.ndim // 2 if a_is_dm else stateA.ndim
+    rest = tuple(i for i in range(n) if i not in modes)
+    rest_shape = tuple(stateA.shape[i] for i in rest)
+    K = int(np.prod([stateA.shape[i] for i in modes]))
+    R = int(np.prod(rest_shape))
+
+    if not a_is_dm:
+        psi = np.transpose(stateA, modes + rest).reshape(K, R)
+        return (np.conj(stateB).reshape(K) @ psi).reshape(rest_shape)
+
+    axes = modes + rest + tuple(n + i for i in modes) + tuple(n + i for i in rest)
+    rho = np.transpose(stateA, axes).reshape(K, R, K, R)
+    if b_is_dm:
+        out = np.tensordot(stateB.reshape(K, K), rho, axes=[[0, 1], [0, 2]])
+    else:
+        ket = stateB.reshape(K)
+        out = (np.conj(ket) @ rho.reshape(K, R * K * R)).reshape(R, K, R)
+        out = np.tensordot(out, ket, axes=[[1], [0]])
+    return out.reshape(rest_shape + rest_shape)
+
+
 def normalize(fock: Tensor, is_dm: bool):
     r"""Returns the normalized ket state.
 
@@ -683,6 +816,15 @@ def trace(dm, keep: List[int]):
         dm: the density matrix
         keep: the modes to keep (0-based)
     """
+    if math.backend_name == "numpy":
+        # a single einsum that sums the traced modes on both sides at once
+        N = dm.ndim // 2
+        left = string.ascii_letters[:N]
+        right = "".join(left[i] if i not in keep else string.ascii_letters[N + i] for i in range(N))
+        out = "".join(left[i] for i in range(N) if i in keep)
+        out += "".join(right[i] for i in range(N) if i in keep)
+        return np.einsum(f"{left}{right}->{out}", dm)
+
     dm = MMTensor(
         dm,
         axis_labels=[
@@ -693,6 +835,23 @@ def trace(dm, keep: List[int]):
     return dm.contract().tensor
 
 
+def ket_trace(ket, keep: List[int]):
+    r"""Computes the partial trace of the density matrix of a ket without constructing it.
+    The output has the same index ordering as :func:`trace`, i.e. the kept 'out' indices
+    followed by the kept 'in' indices, in increasing order.
+
+    Args:
+        ket: the ket
+        keep: the modes to keep (0-based)
+    """
+    kept = sorted(keep)
+    traced = [i for i in range(len(ket.shape)) if i not in kept]
+    kept_shape = [ket.shape[i] for i in kept]
+    vmat = math.reshape(math.transpose(ket, kept + traced), (int(np.prod(kept_shape)), -1))
+    dm = math.matmul(vmat, math.conj(math.transpose(vmat)))
+    return math.reshape(dm, kept_shape + kept_shape)
+
+
 @tensor_int_cache
 def oscillator_eigenstate(q: Vector, cutoff: int) -> Tensor:
     r"""Harmonic oscillator eigenstate wavefunction `\psi_n(q) = <n|q>`.
@@ -816,6 +975,21 @@ def estimate_quadrature_axis(cutoff, minimum=5, period_resolution=20):
     return xaxis
 
 
+@lru_cache
+def _default_quadrature_grid(cutoff: int, hbar: float) -> Tuple[np.ndarray, np.ndarray]:
+    r"""The default quadrature axis for the given cutoff, together with the oscillator
+    eigenstates evaluated on it.
+
+    The eigenstates only depend on the cutoff and on ``hbar``, so they are computed once and
+    reused by every distribution (and homodyne sample) evaluated on the default axis.
+    """
+    x = np.sqrt(hbar) * estimate_quadrature_axis(cutoff)
+    psi_x = math.asnumpy(math.cast(oscillator_eigenstate(x, cutoff), "complex128"))
+    x.flags.writeable = False
+    psi_x.flags.writeable = False
+    return x, psi_x
+
+
 def quadrature_distribution(
     state: Tensor,
     quadrature_angle: float = 0.0,
@@ -845,22 +1019,21 @@ def quadrature_distribution(
 
     if not np.isclose(quadrature_angle, 0.0):
         # rotate mode to the homodyne basis
+        # the rotation is diagonal, so we apply it as an elementwise product with its phases
         theta = -math.arange(cutoff) * quadrature_angle
-        Ur = math.diag(math.make_complex(math.cos(theta), math.sin(theta)))
-        state = (
-            math.einsum("ij,jk,kl->il", Ur, state, math.dagger(Ur))
-            if is_dm
-            else math.matvec(Ur, state)
-        )
+        phases = math.make_complex(math.cos(theta), math.sin(theta))
+        state = state * math.outer(phases, math.conj(phases)) if is_dm else phases * state
 
     if x is None:
-        x = np.sqrt(settings.HBAR) * math.new_constant(estimate_quadrature_axis(cutoff), "q_tensor")
-
-    psi_x = math.cast(oscillator_eigenstate(x, cutoff), "complex128")
+        x, psi_x = _default_quadrature_grid(cutoff, settings.HBAR)
+        x = math.new_constant(x, "q_tensor")
+        psi_x = math.astensor(psi_x)
+    else:
+        psi_x = math.cast(oscillator_eigenstate(x, cutoff), "complex128")
     pdf = (
-        math.einsum("nm,nj,mj->j", state, psi_x, psi_x)
+        math.sum(math.matmul(math.transpose(state), psi_x) * psi_x, axes=[0])
         if is_dm
-        else math.abs(math.einsum("n,nj->j", state, psi_x)) ** 2
+        else math.abs(math.matvec(math.transpose(psi_x), state)) ** 2
     )
 
     return x, math.real(pdf)
@@ -421,6 +421,16 @@ def CPTP(
         Y = math.single_mode_to_multimode_mat(Y, len(transf_modes))
     if d is not None and d.shape[-1] == 2:
         d = math.single_mode_to_multimode_vec(d, len(transf_modes))
+    if list(transf_modes) == list(state_modes):
+        # the channel acts on all the modes in order, so no gathering and scattering is needed
+        if X is not None:
+            cov = math.matmul(X, cov, math.transpose(X))
+            means = math.matvec(X, means)
+        if Y is not None:
+            cov = cov + Y
+        if d is not None:
+            means = means + d
+        return cov, means
     indices = [state_modes.index(i) for i in transf_modes]
     cov = math.left_matmul_at_modes(X, cov, indices)
     cov = math.right_matmul_at_modes(cov, math.transpose(X), indices)
@@ -573,16 +583,20 @@ def general_dyne(
     N, M = cov.shape[-1] // 2, proj_cov.shape[-1] // 2
     # Bmodes are the modes being measured and Amodes are the leftover modes
     Bmodes = modes or list(range(M))
-    Amodes = list(set(list(range(N))) - set(Bmodes))
+    Bset = set(Bmodes)
+    Amodes = [i for i in range(N) if i not in Bset]
 
     A, B, AB = partition_cov(cov, Amodes)
     a, b = partition_means(means, Amodes)
     reduced_cov = B + proj_cov
+    # the reduced covariance matrix is positive-definite, so we solve linear systems
+    # and compute its determinant from its Cholesky factor
+    L = math.cholesky(reduced_cov)
 
     # covariances are divided by 2 to match tensorflow and MrMustard conventions
     # (MrMustard uses Serafini convention where `sigma_MM = 2 sigma_TF`)
     if proj_means is None:
-        pdf = math.MultivariateNormalTriL(loc=b, scale_tril=math.cholesky(reduced_cov / 2))
+        pdf = math.MultivariateNormalTriL(loc=b, scale_tril=L / math.sqrt(2.0, dtype=L.dtype))
         outcome = (
             pdf.sample(dtype=cov.dtype) if proj_means is None else math.cast(proj_means, cov.dtype)
         )
@@ -594,10 +608,8 @@ def general_dyne(
         outcome = proj_means
         prob = (
             settings.HBAR**M
-            * math.exp(
-                -0.5 * math.sum(math.solve(reduced_cov, (proj_means - b)) * (proj_means - b))
-            )
-            / math.sqrt(math.det(reduced_cov))
+            * math.exp(-0.5 * math.sum(math.cholesky_solve(L, (proj_means - b)) * (proj_means - b)))
+            / math.prod(math.diag_part(L))
         )
 
     # calculate conditional output state of unmeasured modes
@@ -605,7 +617,7 @@ def general_dyne(
     if num_remaining_modes == 0:
         return outcome, prob, None, None
 
-    AB_inv = math.matmul(AB, math.inv(reduced_cov))
+    AB_inv = math.transpose(math.cholesky_solve(L, math.transpose(AB)))
     new_cov = A - math.matmul(AB_inv, math.transpose(AB))
     new_means = a + math.matvec(AB_inv, outcome - b)
 
@@ -688,14 +700,15 @@ def partition_cov(cov: Matrix, Amodes: Sequence[int]) -> Tuple[Matrix, Matrix, M
         Tuple[Matrix, Matrix, Matrix]: the cov of ``A``, the cov of ``B`` and the AB block
     """
     N = cov.shape[-1] // 2
-    Bindices = math.cast(
-        [i for i in range(N) if i not in Amodes] + [i + N for i in range(N) if i not in Amodes],
-        "int32",
-    )
+    Aset = set(Amodes)
+    Bmodes = [i for i in range(N) if i not in Aset]
+    Bindices = math.cast(Bmodes + [i + N for i in Bmodes], "int32")
     Aindices = math.cast(Amodes + [i + N for i in Amodes], "int32")
-    A_block = math.gather(math.gather(cov, Aindices, axis=1), Aindices, axis=0)
-    B_block = math.gather(math.gather(cov, Bindices, axis=1), Bindices, axis=0)
-    AB_block = math.gather(math.gather(cov, Bindices, axis=1), Aindices, axis=0)
+    # the rows of A are shared by the A block and the AB block
+    A_rows = math.gather(cov, Aindices, axis=0)
+    A_block = math.gather(A_rows, Aindices, axis=1)
+    B_block = math.gather(math.gather(cov, Bindices, axis=0), Bindices, axis=1)
+    AB_block = math.gather(A_rows, Bindices, axis=1)
     return A_block, B_block, AB_block
 
 
@@ -710,10 +723,9 @@ def partition_means(means: Vector, Amodes: Sequence[int]) -> Tuple[Vector, Vecto
         Tuple[Vector, Vector]: the means of ``A`` and the means of ``B``
     """
     N = len(means) // 2
-    Bindices = math.cast(
-        [i for i in range(N) if i not in Amodes] + [i + N for i in range(N) if i not in Amodes],
-        "int32",
-    )
+    Aset = set(Amodes)
+    Bmodes = [i for i in range(N) if i not in Aset]
+    Bindices = math.cast(Bmodes + [i + N for i in Bmodes], "int32")
     Aindices = math.cast(Amodes + [i + N for i in Amodes], "int32")
     return math.gather(means, Aindices), math.gather(means, Bindices)
 
@@ -51,28 +51,30 @@ def real_gaussian_integral(
 
     if not idx:
         return A, b, c
-    not_idx = tuple(i for i in range(A.shape[-1]) if i not in idx)
+    idx_set = set(idx)
+    not_idx = tuple(i for i in range(A.shape[-1]) if i not in idx_set)
 
-    M = math.gather(math.gather(A, idx, axis=-1), idx, axis=-2)
+    A_idx = math.gather(A, idx, axis=-1)
+    M = math.gather(A_idx, idx, axis=-2)
     bM = math.gather(b, idx, axis=-1)
 
     if math.asnumpy(not_idx).shape != (0,):
-        D = math.gather(math.gather(A, idx, axis=-1), not_idx, axis=-2)
+        D = math.gather(A_idx, not_idx, axis=-2)
         R = math.gather(math.gather(A, not_idx, axis=-1), not_idx, axis=-2)
         bR = math.gather(b, not_idx, axis=-1)
-        T = math.transpose
-        L = T(math.solve(T(M), T(D)))
-        A_post = R - math.matmul(L, T(D))
-        b_post = bR - math.matvec(L, bM)
+        Minv_DT, Minv_bM = _solve_stacked(M, math.transpose(D), bM)
+        A_post = R - math.matmul(D, Minv_DT)
+        b_post = bR - math.matvec(D, Minv_bM)
     else:
         A_post = math.astensor([])
         b_post = math.astensor([])
+        Minv_bM = math.solve(M, bM)
 
     c_post = (
         c
         * math.sqrt((2 * np.pi) ** len(idx), math.complex128)
         * math.sqrt((-1) ** len(idx) / math.det(M), math.complex128)
-        * math.exp(-0.5 * math.sum(bM * math.solve(M, bM)))
+        * math.exp(-0.5 * math.sum(bM * Minv_bM))
     )
 
     return A_post, b_post, c_post
@@ -124,31 +126,46 @@ def complex_gaussian_integral(
     idx = tuple(idx_z) + tuple(idx_zconj)
     if not idx:
         return A, b, c
-    not_idx = tuple(i for i in range(A.shape[-1]) if i not in idx)
+    idx_set = set(idx)
+    not_idx = tuple(i for i in range(A.shape[-1]) if i not in idx_set)
 
     I = math.eye(n, dtype=A.dtype)
     Z = math.zeros((n, n), dtype=A.dtype)
     X = math.block([[Z, I], [I, Z]])
-    M = math.gather(math.gather(A, idx, axis=-1), idx, axis=-2) + X * measure
+    A_idx = math.gather(A, idx, axis=-1)
+    M = math.gather(A_idx, idx, axis=-2) + X * measure
     bM = math.gather(b, idx, axis=-1)
-
-    c_post = (
-        c * math.sqrt((-1) ** n / math.det(M)) * math.exp(-0.5 * math.sum(bM * math.solve(M, bM)))
-    )
-
     if math.asnumpy(not_idx).shape != (0,):
-        D = math.gather(math.gather(A, idx, axis=-1), not_idx, axis=-2)
+        D = math.gather(A_idx, not_idx, axis=-2)
         R = math.gather(math.gather(A, not_idx, axis=-1), not_idx, axis=-2)
         bR = math.gather(b, not_idx, axis=-1)
-        A_post = R - math.matmul(D, math.inv(M), math.transpose(D))
-        b_post = bR - math.matvec(D, math.solve(M, bM))
+        # the solution of the linear system enters both the quadratic form of ``c`` and ``b``
+        Minv_DT, Minv_bM = _solve_stacked(M, math.transpose(D), bM)
+        A_post = R - math.matmul(D, Minv_DT)
+        b_post = bR - math.matvec(D, Minv_bM)
     else:
+        Minv_bM = math.solve(M, bM)
         A_post = math.zeros((0, 0), dtype=A.dtype)
         b_post = math.zeros((0,), dtype=b.dtype)
 
+    c_post = c * math.sqrt((-1) ** n / math.det(M)) * math.exp(-0.5 * math.sum(bM * Minv_bM))
+
     return A_post, b_post, c_post
 
 
+def _solve_stacked(
+    M: ComplexMatrix, B: ComplexMatrix, v: ComplexVector
+) -> Tuple[ComplexMatrix, ComplexVector]:
+    r"""Solves ``M X = B`` and ``M x = v`` with a single factorization of ``M``,
+    by stacking ``v`` as an extra column of ``B``.
+
+    Returns:
+        The solutions ``X`` and ``x``.
+    """
+    sol = math.solve(M, math.concat([B, math.expand_dims(v, -1)], axis=-1))
+    return sol[:, :-1], sol[:, -1]
+
+
 def join_Abc(
     Abc1: Tuple[ComplexMatrix, ComplexVector, complex],
     Abc2: Tuple[ComplexMatrix, ComplexVector, complex],
@@ -199,8 +216,9 @@ def join_Abc_real(
     if (len(idx1) > A1.shape[-1]) or (len(idx2) > A2.shape[-1]):
         raise ValueError(f"idx1 and idx2 must be valid, got {len(idx1)} and {len(idx2)}")
 
-    not_idx1 = tuple(i for i in range(A1.shape[-1]) if i not in idx1)
-    not_idx2 = tuple(i for i in range(A2.shape[-1]) if i not in idx2)
+    idx1_set, idx2_set = set(idx1), set(idx2)
+    not_idx1 = tuple(i for i in range(A1.shape[-1]) if i not in idx1_set)
+    not_idx2 = tuple(i for i in range(A2.shape[-1]) if i not in idx2_set)
 
     A1_idx_idx = math.gather(math.gather(A1, idx1, axis=-1), idx1, axis=-2)
     b1_idx = math.gather(b1, idx1, axis=-1)
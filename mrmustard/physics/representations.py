@@ -265,7 +265,11 @@ class Bargmann(Representation):
         r"""
         Returns a Bargmann object from an ansatz object.
         """
-        return cls(ansatz.A, ansatz.b, ansatz.c)
+        # the ansatz already holds the batched triple, so it is wrapped rather than rebuilt
+        ret = cls.__new__(cls)
+        ret._contract_idxs = ()  # pylint: disable=protected-access
+        ret._ansatz = ansatz  # pylint: disable=protected-access
+        return ret
 
     @property
     def A(self) -> Batch[ComplexMatrix]:
@@ -699,7 +703,9 @@ class Fock(Representation):
         new_array = []
         for i in range(n_batches_s):
             for j in range(n_batches_o):
-                new_array.append(math.tensordot(self.array[i], other.array[j], axes))
+                a, b = self.array[i], other.array[j]
+                # with no axes to contract (e.g. ``ket @ ket.adjoint``) this is an outer product
+                new_array.append(math.tensordot(a, b, axes) if idx_s else math.outer(a, b))
         return self.from_ansatz(ArrayAnsatz(new_array))
 
     def trace(self, idxs1: tuple[int, ...], idxs2: tuple[int, ...]) -> Fock:
@@ -714,9 +720,10 @@ class Fock(Representation):
         """
         if len(idxs1) != len(idxs2) or not set(idxs1).isdisjoint(idxs2):
             raise ValueError("idxs must be of equal length and disjoint")
+        traced = set(idxs1 + idxs2)
         order = (
             [0]
-            + [i + 1 for i in range(len(self.array.shape) - 1) if i not in idxs1 + idxs2]
+            + [i + 1 for i in range(len(self.array.shape) - 1) if i not in traced]
             + [i + 1 for i in idxs1]
             + [i + 1 for i in idxs2]
         )
@@ -775,6 +782,8 @@ class Fock(Representation):
 
         ret = self.array
         for i, s in enumerate(shape):
+            if s >= ret.shape[i]:  # nothing to slice along this axis
+                continue
             slc = (slice(None),) * i + (slice(0, s),) + (slice(None),) * (length - i - 1)
             ret = ret[slc]
         return Fock(array=ret, batched=True)
@@ -17,7 +17,7 @@ This module contains the ``(A, b, c)`` triples for the Fock-Bargmann representat
 various states and transformations.
 """
 
-from typing import Generator, Iterable, Union
+from typing import Callable, Generator, Iterable, Union
 from mrmustard import math, settings
 from mrmustard.utils.typing import Matrix, Vector, Scalar
 
@@ -29,25 +29,57 @@ import numpy as np
 #  ~~~~~~~~~
 
 
+# constant complex tensors shared by all the triples, keyed by name, backend and shape
+_CONSTANTS: dict[tuple[str, str, tuple[int, ...]], Union[Matrix, Vector]] = {}
+
+
+def _constant(name: str, shape: tuple[int, ...], build: Callable) -> Union[Matrix, Vector]:
+    r"""
+    The constant tensor ``build()`` of the given name and shape, allocated once per backend.
+
+    Numpy arrays are made read-only, as they are shared by reference.
+    """
+    key = (name, math.backend_name, shape)
+    if (ret := _CONSTANTS.get(key)) is None:
+        ret = build()
+        if math.backend_name == "numpy":
+            ret.flags.writeable = False
+        _CONSTANTS[key] = ret
+    return ret
+
+
+def _zeros(shape: tuple[int, ...]) -> Union[Matrix, Vector]:
+    r"""
+    A complex zero tensor of the given shape.
+    """
+    return _constant("zeros", shape, lambda: math.zeros(shape, math.complex128))
+
+
 def _X_matrix_for_unitary(n_modes: int) -> Matrix:
     r"""
     The X matrix for the order of unitaries.
     """
-    return math.cast(math.kron(math.astensor([[0, 1], [1, 0]]), math.eye(n_modes)), math.complex128)
+    return _constant(
+        "X",
+        (2 * n_modes, 2 * n_modes),
+        lambda: math.cast(
+            math.kron(math.astensor([[0, 1], [1, 0]]), math.eye(n_modes)), math.complex128
+        ),
+    )
 
 
 def _vacuum_A_matrix(n_modes: int) -> Matrix:
     r"""
     The A matrix of the vacuum state.
     """
-    return math.zeros((n_modes, n_modes), math.complex128)
+    return _zeros((n_modes, n_modes))
 
 
 def _vacuum_B_vector(n_modes: int) -> Vector:
     r"""
     The B vector of the vacuum state.
     """
-    return math.zeros((n_modes,), math.complex128)
+    return _zeros((n_modes,))
 
 
 def _reshape(**kwargs) -> Generator:
@@ -143,9 +175,10 @@ def squeezed_vacuum_state_Abc(
     r, phi = list(_reshape(r=r, phi=phi))
     n_modes = len(r)
 
-    A = math.diag(-math.sinh(r) / math.cosh(r) * math.exp(1j * phi))
+    cosh_r = math.cosh(r)
+    A = math.diag(-math.sinh(r) / cosh_r * math.exp(1j * phi))
     b = _vacuum_B_vector(n_modes)
-    c = math.prod(1 / math.sqrt(math.cosh(r)))
+    c = math.prod(1 / math.sqrt(cosh_r))
 
     return A, b, c
 
@@ -176,13 +209,13 @@ def displaced_squeezed_vacuum_state_Abc(
     """
     x, y, r, phi = list(_reshape(x=x, y=y, r=r, phi=phi))
 
-    A = math.diag(-math.sinh(r) / math.cosh(r) * math.exp(1j * phi))
-    b = (x + 1j * y) + (x - 1j * y) * math.sinh(r) / math.cosh(r) * math.exp(1j * phi)
-    c = math.exp(
-        -0.5 * (x**2 + y**2)
-        - 0.5 * (x - 1j * y) ** 2 * math.sinh(r) / math.cosh(r) * math.exp(1j * phi)
-    )
-    c = math.prod(c / math.sqrt(math.cosh(r)))
+    cosh_r = math.cosh(r)
+    # the squeezing factor enters A, b and c
+    tanhr = math.sinh(r) / cosh_r * math.exp(1j * phi)
+    A = math.diag(-tanhr)
+    b = (x + 1j * y) + (x - 1j * y) * tanhr
+    c = math.exp(-0.5 * (x**2 + y**2) - 0.5 * (x - 1j * y) ** 2 * tanhr)
+    c = math.prod(c / math.sqrt(cosh_r))
 
     return A, b, c
 
@@ -209,11 +242,12 @@ def two_mode_squeezed_vacuum_state_Abc(
     r, phi = list(_reshape(r=r, phi=phi))
     n_modes = 2 * len(r)
     O = math.zeros((len(r), len(r)), math.complex128)
-    tanhr = math.diag(-math.exp(1j * phi) * math.sinh(r) / math.cosh(r))
+    cosh_r = math.cosh(r)
+    tanhr = math.diag(-math.exp(1j * phi) * math.sinh(r) / cosh_r)
 
     A = math.block([[O, tanhr], [tanhr, O]])
     b = _vacuum_B_vector(n_modes)
-    c = math.prod(1 / math.cosh(r))
+    c = math.prod(1 / cosh_r)
 
     return A, b, c
 
@@ -327,12 +361,13 @@ def squeezing_gate_Abc(
     r, delta = _reshape(r=r, delta=delta)
     n_modes = len(delta)
 
-    tanhr = math.diag(math.sinh(r) / math.cosh(r))
-    sechr = math.diag(1 / math.cosh(r))
+    cosh_r = math.cosh(r)
+    tanhr = math.diag(math.sinh(r) / cosh_r)
+    sechr = math.diag(1 / cosh_r)
 
     A = math.block([[-math.exp(1j * delta) * tanhr, sechr], [sechr, math.exp(-1j * delta) * tanhr]])
     b = _vacuum_B_vector(n_modes * 2)
-    c = math.prod(1 / math.sqrt(math.cosh(r)))
+    c = math.prod(1 / math.sqrt(cosh_r))
 
     return A, b, c
 
@@ -399,8 +434,10 @@ def twomode_squeezing_gate_Abc(
     n_modes = 2 * len(r)
 
     O = math.zeros((len(r), len(r)), math.complex128)
-    tanhr = math.diag(math.exp(1j * phi) * math.sinh(r) / math.cosh(r))
-    sechr = math.diag(1 / math.cosh(r))
+    cosh_r = math.cosh(r)
+    sech_r = 1 / cosh_r
+    tanhr = math.diag(math.exp(1j * phi) * math.sinh(r) * sech_r)
+    sechr = math.diag(sech_r)
 
     A_block1 = math.block([[O, -tanhr], [-tanhr, O]])
 
@@ -410,7 +447,7 @@ def twomode_squeezing_gate_Abc(
 
     A = math.block([[A_block1, A_block3], [A_block3, A_block2]])
     b = _vacuum_B_vector(n_modes * 2)
-    c = math.prod(1 / math.cosh(r))
+    c = math.prod(sech_r)
 
     return A, b, c
 
@@ -425,10 +462,7 @@ def identity_Abc(n_modes: int) -> Union[Matrix, Vector, Scalar]:
     Returns:
         The ``(A, b, c)`` triple of the identities.
     """
-    O_n = math.zeros((n_modes, n_modes), dtype=math.complex128)
-    I_n = math.eye(n_modes, dtype=math.complex128)
-
-    A = math.block([[O_n, I_n], [I_n, O_n]])
+    A = _X_matrix_for_unitary(n_modes)
     b = _vacuum_B_vector(n_modes * 2)
     c = 1.0 + 0j
 
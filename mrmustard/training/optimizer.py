@@ -16,7 +16,7 @@
 used within Mr Mustard.
 """
 
-from itertools import chain, groupby
+from itertools import chain
 from typing import List, Callable, Sequence, Union, Mapping, Dict
 from mrmustard import math
 from mrmustard.math.parameters import Constant, Variable
@@ -98,13 +98,15 @@ class Optimizer:
     def _minimize(self, cost_fn, by_optimizing, max_steps, callbacks):
         # finding out which parameters are trainable from the ops
         trainable_params = self._get_trainable_params(by_optimizing)
+        # a single flat list of variables, so that all gradients come from one tape call
+        params = list(trainable_params.values())
         cost_fn_modified = False
         orig_cost_fn = cost_fn
 
         bar = ProgressBar(max_steps)
         with bar:
             while not self.should_stop(max_steps):
-                cost, grads = self.compute_loss_and_gradients(cost_fn, trainable_params.values())
+                cost, grads = self.compute_loss_and_gradients(cost_fn, params)
 
                 trainables = {tag: (x, dx) for (tag, x), dx in zip(trainable_params.items(), grads)}
 
@@ -118,7 +120,7 @@ class Optimizer:
                     trainables=trainables,
                 )
 
-                self.apply_gradients(trainable_params.values(), new_grads or grads)
+                self.apply_gradients(params, new_grads or grads)
                 self.opt_history.append(cost)
                 bar.step(math.asnumpy(cost))
 
@@ -135,23 +137,14 @@ class Optimizer:
         applies the corresponding update method for each variable type. Update methods are
         registered on :mod:`parameter_update` module.
         """
-        grouped_items = sorted(
-            zip(grads, trainable_params),
-            key=lambda x: hash(getattr(x[1], "update_fn", update_euclidean)),
-        )
-        grouped_items = {
-            key: list(result)
-            for key, result in groupby(
-                grouped_items, key=lambda x: hash(getattr(x[1], "update_fn", update_euclidean))
-            )
-        }
+        # group in a single pass, extracting the value (tensor) from each parameter object
+        grouped_items = {}
+        for grad, p in zip(grads, trainable_params):
+            update_fn = getattr(p, "update_fn", update_euclidean)
+            grouped_items.setdefault(update_fn, []).append((grad, p.value))
 
-        for grads_vars in grouped_items.values():
-            update_fn = getattr(grads_vars[0][1], "update_fn", update_euclidean)
-            params_lr = self.learning_rate[update_fn]
-            # extract value (tensor) from the parameter object and group with grad
-            grads_and_vars = [(grad, p.value) for grad, p in grads_vars]
-            update_fn(grads_and_vars, params_lr)
+        for update_fn, grads_and_vars in grouped_items.items():
+            update_fn(grads_and_vars, self.learning_rate[update_fn])
 
     @staticmethod
     def _get_trainable_params(trainable_items, root_tag: str = "optimized"):
@@ -183,15 +176,9 @@ class Optimizer:
     def _group_vars_and_grads_by_type(trainable_params, grads):
         """Groups `trainable_params` and `grads` by type into a dict of the form
         `{"euclidean": [...], "orthogonal": [...], "symplectic": [...]}, "unitary": [...]`."""
-        sorted_grads_and_vars = sorted(
-            zip(grads, trainable_params), key=lambda grads_vars: grads_vars[1].type
-        )
-        grouped = {
-            key: list(result)
-            for key, result in groupby(
-                sorted_grads_and_vars, key=lambda grads_vars: grads_vars[1].type
-            )
-        }
+        grouped = {}
+        for grad, param in zip(grads, trainable_params):
+            grouped.setdefault(param.type, []).append((grad, param))
 
         return grouped
 
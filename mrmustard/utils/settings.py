@@ -76,12 +76,18 @@ class Settings:
         self.AUTOCUTOFF_MIN_CUTOFF = 1
         r"""The minimum value for autocutoff. Default is ``1``."""
 
+        self.REPR_SHOW_WIGNER = True
+        "Whether or not to plot the Wigner function of single-mode states in their html representation. Default is True."
+
         self.CIRCUIT_DRAW_PARAMS = True
         "Whether or not to draw the parameters of a circuit."
 
         self.CIRCUIT_DECIMALS = 3
         "The number of decimal places to display when drawing a circuit."
 
+        self.CIRCUIT_FUSION_MAX_MODES = 4
+        "The maximum number of modes of a group of consecutive Gaussian operations that are fused before being applied to a Gaussian state. Default is 4."
+
         self.DISCRETIZATION_METHOD = "iterative"
         "The method used to discretize the Wigner function. Default is ``iterative``."
 
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 
+import numpy as np
 from hypothesis import given
 
+from mrmustard import settings
 from mrmustard.lab import *
 from tests.random import angle, medium_float, n_mode_pure_state, r
 
@@ -64,3 +66,110 @@ def test_shift(r, phi1, phi2, x, y, G):
     "test that the leftshift/rightshift operator works as expected"
     circ = Sgate(r, phi1) >> Dgate(x, y) >> Rgate(phi2)
     assert G == (circ << G) >> circ
+
+
+def test_gaussian_circuit_matches_op_by_op():
+    "test that applying a Gaussian circuit is the same as applying its ops one at a time"
+    circ = Sgate(0.3)[0] >> BSgate(0.4, 0.1)[0, 1] >> Attenuator(0.8)[1] >> Dgate(0.2, 0.1)[0]
+    state = Vacuum(2)
+    out = state >> circ
+    expected = state
+    for op in circ.ops:
+        expected = op.primal(expected)
+    assert np.allclose(out.cov, expected.cov)
+    assert np.allclose(out.means, expected.means)
+    assert np.allclose(out.norm, expected.norm)
+
+
+def test_gaussian_circuit_fusion():
+    "test that fusing operations into groups does not change the output state"
+    circ = (
+        Sgate([0.3, 0.2])[0, 1]
+        >> BSgate(0.4, 0.1)[1, 2]
+        >> Rgate(0.5)[3]
+        >> Attenuator(0.8)[2]
+        >> Dgate(0.2, 0.1)[0]
+        >> S2gate(0.1, 0.2)[0, 3]
+    )
+    state = Vacuum(4)
+    fusion_max_modes = settings.CIRCUIT_FUSION_MAX_MODES
+    outs = []
+    try:
+        for max_modes in [1, 2, 4]:
+            settings.CIRCUIT_FUSION_MAX_MODES = max_modes
+            outs.append(state >> circ)
+    finally:
+        settings.CIRCUIT_FUSION_MAX_MODES = fusion_max_modes
+    for out in outs[1:]:
+        assert np.allclose(out.cov, outs[0].cov)
+        assert np.allclose(out.means, outs[0].means)
+        assert np.allclose((circ << out).cov, (circ << outs[0]).cov)
+
+
+def test_XYd_dual():
+    "test that the dual triple inverts the action of the transformation"
+    for op in [Sgate(0.3, 0.2), Dgate(0.2, 0.1), Attenuator(0.8), BSgate(0.4, 0.1)]:
+        X, Y, d = (np.array(a) for a in op.XYd(allow_none=False))
+        Xdual, Ydual, ddual = (np.array(a) for a in op.XYd_dual(allow_none=False))
+        assert np.allclose(Xdual @ X, np.eye(X.shape[0]))
+        assert np.allclose(Ydual, Xdual @ Y @ Xdual.T)
+        assert np.allclose(ddual, -Xdual @ d)
+
+
+def test_gaussian_circuit_cache_follows_modes():
+    "test that the cached triples of a circuit are recomputed when an operation changes modes"
+    sgate = Sgate(0.3, 0.2)[0]
+    circ = Circuit([sgate, BSgate(0.4, 0.1)[0, 1]])
+    assert Vacuum(2) >> circ == Vacuum(2) >> Sgate(0.3, 0.2)[0] >> BSgate(0.4, 0.1)[0, 1]
+    sgate[1]
+    assert Vacuum(2) >> circ == Vacuum(2) >> Sgate(0.3, 0.2)[1] >> BSgate(0.4, 0.1)[0, 1]
+
+
+def test_circuit_XYd_is_cached():
+    "test that the triple of a circuit is reused unless it is trainable or its operations change"
+    sgate = Sgate(0.3, 0.2)[0]
+    circ = Circuit([sgate, BSgate(0.4, 0.1)[0, 1]])
+    X, _, _ = circ.XYd()
+    assert circ.XYd()[0] is X
+    sgate[1]
+    assert circ.XYd()[0] is not X
+    assert np.allclose(circ.XYd()[0], (Sgate(0.3, 0.2)[1] >> BSgate(0.4, 0.1)[0, 1]).XYd()[0])
+
+    trainable = Circuit([Sgate(0.3, 0.2, r_trainable=True)[0]])
+    assert trainable.XYd()[0] is not trainable.XYd()[0]
+
+
+def test_call_batch_matches_single_calls():
+    "test that applying a circuit to a batch of states is the same as applying it to each state"
+    circ = Sgate(0.3)[0] >> BSgate(0.4, 0.1)[0, 1] >> Attenuator(0.8)[1] >> Dgate(0.2, 0.1)[0]
+    states = [Vacuum(2), Coherent([0.1, 0.2], [0.3, 0.4]), SqueezedVacuum([0.2, 0.1])]
+    for out, state in zip(circ.call_batch(states), states):
+        expected = state >> circ
+        assert np.allclose(out.cov, expected.cov)
+        assert np.allclose(out.means, expected.means)
+
+    # the triple of the circuit on the modes of the states is composed once
+    X = circ._XYd_on_modes([0, 1])[0]  # pylint: disable=protected-access
+    assert circ._XYd_on_modes([0, 1])[0] is X  # pylint: disable=protected-access
+
+    fock_states = [Fock([1, 0]), Coherent([0.1, 0.2], [0.3, 0.4])]
+    for out, state in zip(circ.call_batch(fock_states), fock_states):
+        assert np.allclose(out.dm(), (state >> circ).dm())
+
+
+def test_compile():
+    "test that a compiled circuit returns the triple of the circuit, following parameters and modes"
+    sgate = Sgate(0.3, 0.2, r_trainable=True)[1]
+    circ = Circuit(
+        [sgate, BSgate(0.4, 0.1)[1, 3], Attenuator(0.8)[3], Dgate([0.2, 0.3], 0.1)[1, 3]]
+    )
+    xyd = circ.compile()
+    for _ in range(2):
+        X, Y, d = (np.array(a) for a in xyd())
+        state = Coherent([0.1, 0.2], [0.3, 0.4], modes=[1, 3])
+        cov, means = np.array(state.cov), np.array(state.means)
+        expected = state >> circ
+        assert np.allclose(X @ cov @ X.T + Y, expected.cov)
+        assert np.allclose(X @ means + d, expected.means)
+        sgate.r.value = 0.5
+        sgate[3]
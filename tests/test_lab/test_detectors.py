@@ -309,6 +309,13 @@ class TestHomodyneDetector:
         var = results.var(axis=0)
         assert np.allclose(var[0], var_expected, atol=self.std_10, rtol=0)
 
+    def test_homodyne_on_single_mode_fock_state(self):
+        """Check that measuring every mode of a Fock state returns the outcome probability."""
+        state = State(dm=Coherent(x=0.3).dm([10]))
+        probability = Homodyne(0.0).primal(state)
+        assert not isinstance(probability, State)
+        assert probability > 0
+
     def test_homodyne_squeezing_setting(self):
         r"""Check default homodyne squeezing on settings leads to the correct generaldyne
         covarince matrix: one that has tends to :math:`diag(1/\sigma[1,1],0)`."""
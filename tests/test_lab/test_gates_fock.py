@@ -413,3 +413,41 @@ def test_phasenoise_zero_noise():
     G1 = Gaussian(1)
     P = PhaseNoise(0.0)
     assert (G1 >> P) == State(dm=G1.dm())
+
+
+@pytest.mark.parametrize("gate_cls, modes", [(BSgate, [1, 3]), (S2gate, [3, 1])])
+def test_twomode_gate_selection_rule_matches_generic(gate_cls, modes):
+    "tests that the selection-rule contraction of BSgate and S2gate matches the generic one"
+    gate = gate_cls(0.3, 0.2, modes=modes)
+    rng = np.random.default_rng(7)
+    ket = rng.normal(size=(3, 4, 2, 5)) + 1j * rng.normal(size=(3, 4, 2, 5))
+    idx = [gate.modes[0], gate.modes[1]]
+    U = gate.U(cutoffs=[ket.shape[i] for i in idx])
+    diff = gate._selection_rule == "difference"
+
+    expected = fock.apply_kraus_to_ket(U, ket, idx)
+    assert np.allclose(fock.apply_twomode_gate_to_ket(U, ket, idx, diff), expected)
+
+    dm = np.einsum("abcd,efgh->abcdefgh", ket, ket.conj())
+    expected = fock.apply_kraus_to_dm(U, dm, idx)
+    assert np.allclose(fock.apply_twomode_gate_to_dm(U, dm, idx, diff), expected)
+
+
+@pytest.mark.parametrize("modes", [[2], [1, 3], [3, 0]])
+def test_diagonal_gate_matches_generic(modes):
+    "tests that the diagonal contraction of Rgate matches the generic one"
+    gate = Rgate([0.3, 0.5][: len(modes)], modes=modes)
+    rng = np.random.default_rng(7)
+    ket = rng.normal(size=(3, 4, 2, 5)) + 1j * rng.normal(size=(3, 4, 2, 5))
+    cutoffs = [ket.shape[i] for i in modes]
+    U = gate.U(cutoffs=cutoffs)
+    diag = gate.U(cutoffs=cutoffs, diag_only=True)
+    size = int(np.prod(cutoffs))
+    assert np.allclose(math.reshape(diag, [-1]), math.diag_part(math.reshape(U, [size, size])))
+
+    expected = fock.apply_kraus_to_ket(U, ket, modes)
+    assert np.allclose(fock.apply_diagonal_gate_to_ket(diag, ket, modes), expected)
+
+    dm = np.einsum("abcd,efgh->abcdefgh", ket, ket.conj())
+    expected = fock.apply_kraus_to_dm(U, dm, modes)
+    assert np.allclose(fock.apply_diagonal_gate_to_dm(diag, dm, modes), expected)
@@ -1,8 +1,10 @@
+from copy import copy
+
 import numpy as np
 
 from mrmustard import math
-from mrmustard.lab import Attenuator, Coherent, Gaussian, Vacuum, Dgate
-from mrmustard.lab.abstract.state import mikkel_plot
+from mrmustard.lab import Attenuator, Coherent, Gaussian, Vacuum, Dgate, Sgate
+from mrmustard.lab.abstract.state import State, mikkel_plot
 
 
 def test_addition():
@@ -69,3 +71,115 @@ def test_rshift():
     _ = vac0 >> d1
     assert np.all(vac0_cov_original == vac0.cov)
     assert np.all(vac0_means_original == vac0.means)
+
+
+def test_fock_probabilities_mixed_gaussian():
+    """Tests that the probabilities of a mixed Gaussian state are the diagonal of its dm."""
+    state = Gaussian(2) >> Dgate([0.1, 0.2], [0.3, 0.1]) >> Attenuator([0.8, 0.6])
+    cutoffs = [5, 6]
+    dm = math.asnumpy(state.dm(cutoffs)).reshape(30, 30)
+    expected = np.real(np.diag(dm)).reshape(cutoffs)
+    assert np.allclose(state.fock_probabilities(cutoffs), expected)
+
+
+def test_concat_mixed_fock():
+    """Tests that concatenating mixed Fock states interleaves the ket and bra indices."""
+    state1 = State(dm=(Gaussian(1) >> Attenuator(0.8)).dm([3]))
+    state2 = State(dm=(Gaussian(2) >> Attenuator([0.7, 0.9])).dm([2, 4]))
+    dm1, dm2 = math.asnumpy(state1.dm()), math.asnumpy(state2.dm())
+    expected = np.transpose(np.tensordot(dm1, dm2, [[], []]), [0, 2, 3, 1, 4, 5])
+    assert np.allclose((state1 & state2).dm(), expected)
+
+
+def test_concat_mixed_and_pure_fock():
+    """Tests that concatenating a mixed Fock state with a pure one gives the right dm."""
+    mixed = State(dm=(Gaussian(1) >> Attenuator(0.8)).dm([3]))
+    pure = State(ket=Gaussian(2).ket([2, 4]))
+    expected = np.transpose(
+        np.tensordot(math.asnumpy(mixed.dm()), math.asnumpy(pure.dm()), [[], []]),
+        [0, 2, 3, 1, 4, 5],
+    )
+    assert np.allclose((mixed & pure).dm(), expected)
+    assert np.allclose((pure & mixed).dm(), np.transpose(expected, [1, 2, 0, 4, 5, 3]))
+
+
+def test_fock_probabilities_follow_cutoffs():
+    """Tests that the cached probabilities are not reused for different cutoffs."""
+    state = Coherent(x=0.3, y=0.1)
+    probs5 = state.fock_probabilities([5])
+    probs8 = state.fock_probabilities([8])
+    assert probs5.shape == (5,)
+    assert probs8.shape == (8,)
+    assert np.allclose(probs8[:5], probs5)
+
+
+def test_dm_of_pure_state_given_as_dm():
+    """Tests that a pure state given as a dm returns it without going through a ket."""
+    dm = math.asnumpy(Coherent(x=0.3, y=0.2).dm([6]))
+    state = State(dm=dm)
+    assert np.allclose(state.dm([4]), dm[:4, :4])
+    assert np.allclose(state.dm([8])[:6, :6], dm)
+    assert np.allclose(state.fock_probabilities([6]), np.real(np.diag(dm)))
+    assert state._ket is None
+
+
+def test_projection_keeps_mode_order():
+    """Tests that the remaining modes of a projection follow the order of the projected state."""
+    state = (Gaussian(3) >> Dgate([0.1, 0.2, 0.3]))[2, 0, 1]
+    assert (state << Vacuum(1)[0]).modes == [2, 1]
+
+
+def test_gaussian_fock_amplitudes_are_reused():
+    """Tests that the Fock amplitudes of a Gaussian state are reused for smaller cutoffs."""
+    state = Gaussian(2) >> Attenuator([0.9, 0.8])
+    dm = math.asnumpy(state.dm([4, 5]))
+    assert state._dm_cutoffs == [4, 5]
+    assert np.allclose(state.dm([3, 5]), dm[:3, :, :3, :])
+    assert state._dm_cutoffs == [4, 5]
+    assert np.allclose(state.dm([5, 5])[:4, :, :4, :], dm)
+    assert state._dm_cutoffs == [5, 5]
+
+
+def test_purity_hint():
+    """Tests that the purity of states known to be pure is not recomputed."""
+    state = Coherent(x=0.1) >> Dgate(0.2)
+    assert state._purity == 1.0
+    assert state.is_pure
+    assert np.isclose((state >> Attenuator(0.5)).purity, 1.0)  # a lossy coherent state is pure
+    assert not (Gaussian(1) >> Attenuator(0.5)).is_pure
+
+
+def test_no_purity_hint_for_trainable_eigenvalues():
+    """Tests that Gaussian states with trainable eigenvalues are not assumed to stay pure."""
+    state = Gaussian(1, symplectic=np.eye(2), eigenvalues_trainable=True)
+    assert state.is_pure
+    state.eigenvalues.value = [3.0]
+    assert np.isclose(state.purity, 1 / 3)
+    assert not state.is_pure
+
+    out = state >> Sgate(0.2)
+    assert np.isclose(out.purity, 1 / 3)
+    dm = math.asnumpy(out.dm([30]))
+    assert np.isclose(np.trace(dm), 1.0)
+    assert np.isclose(np.trace(dm @ dm), 1 / 3)
+
+
+def test_getitem_returns_relabelled_copy():
+    """Tests that setting the modes of a state does not modify the original state."""
+    state = Coherent(x=[0.1, 0.2])
+    assert state.indices(1) == 1
+    relabelled = state[3, 1]
+    assert relabelled.modes == [3, 1]
+    assert relabelled.indices(1) == 1
+    assert state.modes == [0, 1]
+    assert state.indices(1) == 1
+    assert state[0, 1] is state
+
+
+def test_copy_shares_tensors():
+    """Tests that a shallow copy of a state shares its Fock tensors."""
+    state = State(ket=Coherent(x=0.1).ket([5]))
+    state.indices(0)
+    clone = copy(state)
+    assert clone._ket is state._ket
+    assert clone._mode_indices is None
@@ -320,3 +320,24 @@ def test_state_repr_big_prob():
     state = State(ket=np.array([0.5, 0.5]))
     table = state._repr_markdown_()  # pylint: disable=protected-access
     assert "50.000%" in table
+
+
+def test_state_repr_format_probability():
+    "test that missing and tensor probabilities are formatted"
+    assert State._format_probability(None) == "None"  # pylint: disable=protected-access
+    prob = math.astensor(0.5)
+    assert State._format_probability(prob) == "50.000%"  # pylint: disable=protected-access
+
+
+def test_state_repr_without_wigner(monkeypatch):
+    "test that the Wigner plot can be left out of the html representation"
+    calls = []
+    monkeypatch.setattr("mrmustard.lab.abstract.state.mikkel_plot", calls.append)
+    state = State(ket=np.array([0.5, 0.5]))
+    settings.REPR_SHOW_WIGNER = False
+    try:
+        table = state._repr_markdown_()  # pylint: disable=protected-access
+    finally:
+        settings.REPR_SHOW_WIGNER = True
+    assert "50.000%" in table
+    assert not calls
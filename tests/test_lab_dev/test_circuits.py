@@ -201,6 +201,15 @@ class TestCircuit:
 
         assert circ1 >> circ2 == Circuit([vac, s01, bs01, bs12])
 
+    def test_rshift_copies_new_components(self):
+        bs01 = BSgate([0, 1])
+        circ = Circuit([bs01])
+        circ2 = circ >> circ
+
+        assert circ2.components[0] is circ.components[0]
+        assert circ2.components[1] is not circ.components[0]
+        assert circ2.components[1].wires.id != circ.components[0].wires.id
+
     def test_repr(self):
         vac01 = Vacuum([0, 1])
         vac1 = Vacuum([1])
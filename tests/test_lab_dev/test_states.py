@@ -448,6 +448,13 @@ class TestDM:
         assert math.allclose(state.purity, 1)
         assert state.is_pure
 
+    def test_purity_is_cached(self):
+        state = Coherent([0], x=1).dm() / 2 + Coherent([0], x=-1).dm() / 2
+        purity = state.purity
+        assert state._purity_cache[0] is state.representation
+        assert state.purity is purity
+        assert not state.is_pure
+
     def test_expectation_bargmann(self):
         ket = Coherent([0, 1], x=1, y=[2, 3])
         dm = ket.dm()
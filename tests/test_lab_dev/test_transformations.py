@@ -36,6 +36,9 @@ from mrmustard.lab_dev.transformations import (
 from mrmustard.lab_dev.wires import Wires
 from mrmustard.lab_dev.states import Vacuum, TwoModeSqueezedVacuum
 
+# the ``b`` vector of the four-wire operations without displacement
+B_ZEROS_4 = np.zeros((1, 4))
+
 
 class TestOperation:
     r"""
@@ -200,7 +203,7 @@ class TestBSgate:
             ]
         ]
         assert math.allclose(rep1.A, A_exp)
-        assert math.allclose(rep1.b, np.zeros((1, 4)))
+        assert math.allclose(rep1.b, B_ZEROS_4)
         assert math.allclose(rep1.c, [1])
 
         rep2 = BSgate([0, 1], 0.1).representation
@@ -213,7 +216,7 @@ class TestBSgate:
             ]
         ]
         assert math.allclose(rep2.A, A_exp)
-        assert math.allclose(rep2.b, np.zeros((1, 4)))
+        assert math.allclose(rep2.b, B_ZEROS_4)
         assert math.allclose(rep2.c, [1])
 
     def test_trainable_parameters(self):
@@ -230,6 +233,16 @@ class TestBSgate:
         gate3.phi.value = 2
         assert gate3.phi.value == 2
 
+    def test_representation_cache(self):
+        gate1 = BSgate([0, 1], 0.1, 0.2)
+        assert gate1.representation is gate1.representation
+
+        gate2 = BSgate([0, 1], 0.1, 0.2, theta_trainable=True)
+        rep = gate2.representation
+        gate2.theta.value = 0.3
+        assert gate2.representation is not rep
+        assert math.allclose(gate2.representation.A, BSgate([0, 1], 0.3, 0.2).representation.A)
+
 
 class TestDgate:
     r"""
@@ -254,21 +267,33 @@ class TestDgate:
         with pytest.raises(ValueError, match="Length of ``y``"):
             Dgate(modes=[0, 1], x=1, y=[2, 3, 4])
 
-    def test_representation(self):
-        rep1 = Dgate(modes=[0], x=0.1, y=0.1).representation
-        assert math.allclose(rep1.A, [[[0, 1], [1, 0]]])
-        assert math.allclose(rep1.b, [[0.1 + 0.1j, -0.1 + 0.1j]])
-        assert math.allclose(rep1.c, [0.990049833749168])
-
-        rep2 = Dgate(modes=[0, 1], x=[0.1, 0.2], y=0.1).representation
-        assert math.allclose(rep2.A, [[[0, 0, 1, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 1, 0, 0]]])
-        assert math.allclose(rep2.b, [[0.1 + 0.1j, 0.2 + 0.1j, -0.1 + 0.1j, -0.2 + 0.1j]])
-        assert math.allclose(rep2.c, [0.9656054162575665])
-
-        rep3 = Dgate(modes=[1, 8], x=[0.1, 0.2]).representation
-        assert math.allclose(rep3.A, [[[0, 0, 1, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 1, 0, 0]]])
-        assert math.allclose(rep3.b, [[0.1, 0.2, -0.1, -0.2]])
-        assert math.allclose(rep3.c, [0.9753099120283327])
+    representations = [
+        (
+            ([0], 0.1, 0.1),
+            [[[0, 1], [1, 0]]],
+            [[0.1 + 0.1j, -0.1 + 0.1j]],
+            [0.990049833749168],
+        ),
+        (
+            ([0, 1], [0.1, 0.2], 0.1),
+            [[[0, 0, 1, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 1, 0, 0]]],
+            [[0.1 + 0.1j, 0.2 + 0.1j, -0.1 + 0.1j, -0.2 + 0.1j]],
+            [0.9656054162575665],
+        ),
+        (
+            ([1, 8], [0.1, 0.2]),
+            [[[0, 0, 1, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, 1, 0, 0]]],
+            [[0.1, 0.2, -0.1, -0.2]],
+            [0.9753099120283327],
+        ),
+    ]
+
+    @pytest.mark.parametrize("args,A,b,c", representations)
+    def test_representation(self, args, A, b, c):
+        rep = Dgate(*args).representation
+        assert math.allclose(rep.A, A)
+        assert math.allclose(rep.b, b)
+        assert math.allclose(rep.c, c)
 
     def test_trainable_parameters(self):
         gate1 = Dgate([0], 1, 1)
@@ -334,7 +359,7 @@ class TestRgate:
                 ]
             ],
         )
-        assert math.allclose(rep2.b, np.zeros((1, 4)))
+        assert math.allclose(rep2.b, B_ZEROS_4)
         assert math.allclose(rep2.c, [1.0 + 0.0j])
 
         rep3 = Rgate(modes=[1], phi=0.1).representation
@@ -414,7 +439,7 @@ class TestSgate:
                 ]
             ],
         )
-        assert math.allclose(rep2.b, np.zeros((1, 4)))
+        assert math.allclose(rep2.b, B_ZEROS_4)
         assert math.allclose(rep2.c, [0.9756354961606032])
 
         rep3 = Sgate(modes=[1], r=0.1).representation
@@ -496,7 +521,7 @@ class TestIdentity:
                 ]
             ],
         )
-        assert math.allclose(rep2.b, np.zeros((1, 4)))
+        assert math.allclose(rep2.b, B_ZEROS_4)
         assert math.allclose(rep2.c, [1.0 + 0.0j])
 
 
@@ -535,7 +560,7 @@ class TestS2gate:
             ]
         ]
         assert math.allclose(rep1.A, A_exp)
-        assert math.allclose(rep1.b, np.zeros((1, 4)))
+        assert math.allclose(rep1.b, B_ZEROS_4)
         assert math.allclose(rep1.c, [1 / np.cosh(0.1)])
 
     def test_trainable_parameters(self):
@@ -584,7 +609,7 @@ class TestAttenuator:
         rep1 = Attenuator(modes=[0], transmissivity=0.1).representation
         e = 0.31622777
         assert math.allclose(rep1.A, [[[0, e, 0, 0], [e, 0, 0, 0.9], [0, 0, 0, e], [0, 0.9, e, 0]]])
-        assert math.allclose(rep1.b, np.zeros((1, 4)))
+        assert math.allclose(rep1.b, B_ZEROS_4)
         assert math.allclose(rep1.c, [1.0])
 
     def test_trainable_parameters(self):
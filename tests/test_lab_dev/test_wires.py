@@ -97,6 +97,7 @@ class TestWires:
         assert w.output.ket.modes == w_adj.output.bra.modes
         assert w.input.bra.modes == w_adj.input.ket.modes
         assert w.output.bra.modes == w_adj.output.ket.modes
+        assert w_adj.index_dicts == [{6: 0, 7: 1}, {8: 2}, {0: 3, 1: 4, 2: 5}, {3: 6, 4: 7, 5: 8}]
 
     def test_dual(self):
         w = Wires({0, 1, 2}, {3, 4, 5}, {6, 7}, {8})
@@ -105,6 +106,7 @@ class TestWires:
         assert w.output.ket.modes == w_d.input.ket.modes
         assert w.input.bra.modes == w_d.output.bra.modes
         assert w.output.bra.modes == w_d.input.bra.modes
+        assert w_d.index_dicts == [{3: 0, 4: 1, 5: 2}, {0: 3, 1: 4, 2: 5}, {8: 6}, {6: 7, 7: 8}]
 
     def test_add(self):
         w1 = Wires({0}, {0, 1}, {2}, {3})
@@ -91,6 +91,24 @@ class TestBackendManager:
         with pytest.raises(ValueError, match="Cannot compare"):
             math.allclose(arr1, arr2)
 
+    def test_all_diagonals(self):
+        r"""
+        Tests the ``all_diagonals`` method, also on a sliced density matrix.
+        """
+        rho = np.arange(3**4).reshape((3, 3, 3, 3)) * (1 + 1j)
+        expected = np.array([[rho[i, j, i, j] for j in range(3)] for i in range(3)])
+        assert np.allclose(
+            math.asnumpy(math.all_diagonals(math.astensor(rho), real=False)), expected
+        )
+        assert np.allclose(
+            math.asnumpy(math.all_diagonals(math.astensor(rho), real=True)), expected.real
+        )
+
+        sliced = rho[:2, :3, :2, :3]
+        assert np.allclose(
+            math.asnumpy(math.all_diagonals(math.astensor(sliced), real=False)), expected[:2]
+        )
+
     @pytest.mark.parametrize("l", lists)
     def test_any(self, l):
         r"""
@@ -247,6 +265,17 @@ class TestBackendManager:
         exp = arr.astype(np_dtype or np.float64)
         assert np.allclose(res, exp)
 
+    def test_cholesky_solve(self):
+        r"""
+        Tests the ``cholesky_solve`` method.
+        """
+        arr = np.array([[2.0, 1.0], [1.0, 3.0]])
+        chol = math.cholesky(arr)
+        vec = np.array([1.0, 2.0])
+        assert np.allclose(arr @ math.asnumpy(math.cholesky_solve(chol, vec)), vec)
+        mat = np.array([[1.0, 0.0], [2.0, 1.0]])
+        assert np.allclose(arr @ math.asnumpy(math.cholesky_solve(chol, mat)), mat)
+
     @pytest.mark.parametrize("l", [l1, l3])
     def test_clip(self, l):
         r"""
@@ -268,6 +297,28 @@ class TestBackendManager:
         res = math.asnumpy(math.concat(*params))
         return np.allclose(res, np.concatenate(*params))
 
+    @pytest.mark.parametrize(
+        "bounds, expected",
+        [
+            ((None, None), None),
+            ((0.0, None), [0.0, 0.5, 3.0]),
+            ((None, 1.0), [-1.0, 0.5, 1.0]),
+            ((0.0, 1.0), [0.0, 0.5, 1.0]),
+            ((-np.inf, 1.0), [-1.0, 0.5, 1.0]),
+        ],
+    )
+    def test_constraint_func(self, bounds, expected):
+        r"""
+        Tests the ``constraint_func`` method.
+        """
+        skip_np()
+        func = math.constraint_func(bounds)
+        if expected is None:
+            assert func is None
+        else:
+            arr = math.astensor(np.array([-1.0, 0.5, 3.0]))
+            assert np.allclose(math.asnumpy(func(arr)), expected)
+
     @pytest.mark.parametrize("l", lists)
     def test_conj(self, l):
         r"""
@@ -639,6 +690,24 @@ class TestBackendManager:
         results = [math.Categorical(probs, "") for _ in range(100)]
         assert len(set(results)) > 1
 
+    @pytest.mark.parametrize("num_modes", [1, 3])
+    def test_random_symplectic(self, num_modes):
+        r"""
+        Tests that ``random_symplectic`` returns a symplectic matrix.
+        """
+        S = math.asnumpy(math.random_symplectic(num_modes))
+        J = math.J(num_modes)
+        assert S.shape == (2 * num_modes, 2 * num_modes)
+        assert np.allclose(S.T @ J @ S, J)
+
+    def test_categorical_sample(self):
+        r"""
+        Tests that samples of ``Categorical`` only land on outcomes with nonzero probability.
+        """
+        dist = math.Categorical(np.array([0.0, 0.0, 1.0, 0.0]), "")
+        samples = [int(math.asnumpy(dist.sample())) for _ in range(20)]
+        assert samples == [2] * 20
+
     @patch("importlib.metadata.distribution")
     @patch("platform.processor")
     @patch("platform.system")
@@ -84,8 +84,8 @@ def test_vanillabatchNumba_vs_vanillaNumba(batch_size):
 
     G_batched = math.hermite_renormalized_batch(A, B_batched, C, shape=cutoffs)
 
-    for nb in range(batch_size):
-        assert np.allclose(G_ref, G_batched[:, :, :, :, nb])
+    assert G_batched.shape == G_ref.shape + (batch_size,)
+    assert np.allclose(G_batched, np.expand_dims(G_ref, -1))
 
 
 @pytest.mark.parametrize("batch_size", [1, 3])
@@ -106,5 +106,5 @@ def test_diagonalbatchNumba_vs_diagonalNumba(batch_size):
 
     G_batched = math.hermite_renormalized_diagonal_batch(A, B_batched, C, cutoffs=cutoffs[:-1])
 
-    for nb in range(batch_size):
-        assert np.allclose(G_ref, G_batched[:, :, :, nb])
+    assert G_batched.shape == G_ref.shape + (batch_size,)
+    assert np.allclose(G_batched, np.expand_dims(G_ref, -1))
@@ -52,6 +52,20 @@ class TestParameterSet:
         assert ps.constants == {"const1": const1, "const2": const2}
         assert ps.variables == {"var1": var1}
 
+    def test_all_parameters(self):
+        r"""
+        Tests the ``all_parameters`` property.
+        """
+        const1 = Constant(1, "const1")
+        var1 = Variable(1, "var1")
+
+        ps = ParameterSet()
+        ps.add_parameter(const1)
+        ps.add_parameter(var1)
+
+        assert ps.all_parameters == {"const1": const1, "var1": var1}
+        assert ps.constants == {"const1": const1}
+
     def test_tagged_variables(self):
         r"""
         Tests the ``tagged_variables`` method.
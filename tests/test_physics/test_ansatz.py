@@ -16,6 +16,8 @@
 
 # pylint: disable = missing-function-docstring, pointless-statement, comparison-with-itself
 
+import itertools
+
 import numpy as np
 import pytest
 
@@ -75,6 +77,21 @@ class TestPolyExpAnsatz:
         assert np.allclose(ansatz3.vec[0], b1 + b2)
         assert np.allclose(ansatz3.array[0], c1 * c2)
 
+    def test_mul_batched(self):
+        A1, b1, c1 = Abc_triple(3)
+        A2, b2, c2 = Abc_triple(3)
+        A3, b3, c3 = Abc_triple(3)
+
+        ansatz = PolyExpAnsatz([A1, A2], [b1, b2], [c1, c2])
+        ansatz2 = PolyExpAnsatz([A2, A3], [b2, b3], [c2, c3])
+        ansatz3 = ansatz * ansatz2
+
+        assert ansatz3.batch_size == 4
+        for i, (x, y) in enumerate(itertools.product([0, 1], [0, 1])):
+            assert np.allclose(ansatz3.mat[i], ansatz.mat[x] + ansatz2.mat[y])
+            assert np.allclose(ansatz3.vec[i], ansatz.vec[x] + ansatz2.vec[y])
+            assert np.allclose(ansatz3.array[i], ansatz.array[x] * ansatz2.array[y])
+
     def test_mul_scalar(self):
         A, b, c = Abc_triple(5)
         d = 0.1
@@ -104,6 +121,19 @@ class TestPolyExpAnsatz:
         assert np.allclose(ansatz3.vec[0], math.concat([b1, b2], -1))
         assert np.allclose(ansatz3.array[0], c1 * c2)
 
+    def test_and_batched(self):
+        A1, b1, _ = Abc_triple(2)
+        A2, b2, _ = Abc_triple(3)
+
+        ansatz = PolyExpAnsatz([A1, 2 * A1], [b1, 2 * b1], [[1.0, 2.0], [3.0, 4.0]])
+        ansatz2 = PolyExpAnsatz([A2, 3 * A2], [b2, 3 * b2], [5.0, 6.0])
+        ansatz3 = ansatz & ansatz2
+
+        for i, (x, y) in enumerate(itertools.product([0, 1], [0, 1])):
+            assert np.allclose(ansatz3.mat[i], math.block_diag(ansatz.mat[x], ansatz2.mat[y]))
+            assert np.allclose(ansatz3.vec[i], math.concat([ansatz.vec[x], ansatz2.vec[y]], -1))
+            assert np.allclose(ansatz3.array[i], math.outer(ansatz.array[x], ansatz2.array[y]))
+
     def test_eq(self):
         A, b, c = Abc_triple(5)
 
@@ -131,6 +161,29 @@ class TestPolyExpAnsatz:
         assert len(ansatz.b) == 1
         assert ansatz.c == 2 * c
 
+    def test_simplify_combines_equal_terms_only(self):
+        A1, b1, c1 = Abc_triple(4)
+        A2, b2, c2 = Abc_triple(4)
+
+        ansatz = PolyExpAnsatz([A1, A2, A1], [b1, b2, b1], [c1, c2, 3 * c1])
+        ansatz.simplify()
+
+        assert len(ansatz.A) == 2
+        assert np.allclose(ansatz.A, [A1, A2])
+        assert np.allclose(ansatz.b, [b1, b2])
+        assert np.allclose(ansatz.c, [4 * c1, c2])
+
+    @pytest.mark.parametrize("eps", [1e-9, 1e-20])
+    def test_simplify_combines_terms_within_tolerance(self, eps):
+        A = np.full((2, 2), 1.5e-10 + 0j)
+        b = np.zeros(2, dtype=np.complex128)
+
+        ansatz = PolyExpAnsatz([A - eps, A + eps], [b, b], [1, 2])
+        ansatz.simplify()
+
+        assert len(ansatz.A) == 1
+        assert np.allclose(ansatz.c, [3])
+
     def test_simplify_v2(self):
         A, b, c = Abc_triple(5)
 
@@ -263,6 +263,15 @@ def test_fock_trace_function():
     assert np.allclose(dm_traced, State(dm=dm).get_modes(0).dm(), atol=1e-5)
 
 
+def test_fock_ket_trace_function():
+    """tests that the partial trace of a ket matches the partial trace of its dm"""
+    state = Vacuum(3) >> Ggate(3)
+    ket = state.ket([3, 4, 5])
+    dm = fock.ket_to_dm(ket)
+    assert np.allclose(fock.ket_trace(ket, keep=[0, 2]), fock.trace(dm, keep=[0, 2]))
+    assert np.allclose(State(ket=ket).get_modes(1).dm(), fock.trace(dm, keep=[1]))
+
+
 def test_dm_choi():
     """tests that choi op is correctly applied to a dm"""
     circ = Ggate(1) >> Attenuator([0.1])
@@ -271,6 +280,24 @@ def test_dm_choi():
     assert np.allclose(dm_out, dm_expected, atol=1e-5)
 
 
+def test_contract_states_matches_generic_contraction():
+    """tests that contract_states agrees with the kraus and choi contractions"""
+    rng = np.random.default_rng(7)
+    ket_a = rng.normal(size=(2, 3, 4)) + 1j * rng.normal(size=(2, 3, 4))
+    ket_b = rng.normal(size=(4, 2)) + 1j * rng.normal(size=(4, 2))
+    dm_a, dm_b = fock.ket_to_dm(ket_a), fock.ket_to_dm(ket_b)
+    modes = [2, 0]
+
+    expected = fock.apply_kraus_to_ket(np.conj(ket_b), ket_a, modes, [])
+    assert np.allclose(fock.contract_states(ket_a, ket_b, False, False, modes, False), expected)
+    expected = fock.apply_kraus_to_dm(np.conj(ket_b), dm_a, modes, [])
+    assert np.allclose(fock.contract_states(dm_a, ket_b, True, False, modes, False), expected)
+    expected = fock.apply_choi_to_dm(dm_b, dm_a, modes, [])
+    assert np.allclose(fock.contract_states(dm_a, dm_b, True, True, modes, False), expected)
+    expected = expected / np.trace(expected)
+    assert np.allclose(fock.contract_states(dm_a, dm_b, True, True, modes, True), expected)
+
+
 def test_single_mode_choi_application_order():
     """Test dual operations output the correct mode ordering"""
     s = Attenuator(1.0) << State(dm=SqueezedVacuum(1.0, np.pi / 2).dm([40]))  # apply identity gate
@@ -478,3 +505,15 @@ def test_number_variances_fock():
 def test_normalize_dm():
     dm = np.array([[0.2, 0], [0, 0.2]])
     assert np.allclose(fock.normalize(dm, True), np.array([[0.5, 0], [0, 0.5]]))
+
+
+def test_quadrature_distribution_default_axis():
+    """tests that the cached default axis gives the same distribution as an explicit axis"""
+    ket = math.asnumpy(Coherent(x=0.3, y=-0.2).ket(cutoffs=[10]))
+    x, pdf = fock.quadrature_distribution(ket, np.pi / 3)
+    x_explicit = np.array(math.asnumpy(x))
+    _, pdf_explicit = fock.quadrature_distribution(ket, np.pi / 3, x_explicit)
+    assert np.allclose(math.asnumpy(pdf), math.asnumpy(pdf_explicit))
+
+    _, pdf_dm = fock.quadrature_distribution(fock.ket_to_dm(ket), np.pi / 3)
+    assert np.allclose(math.asnumpy(pdf_dm), math.asnumpy(pdf))
@@ -80,3 +80,32 @@ def test_CPTP_with_none_XYd():
     )
     assert np.allclose(cov, np.eye(2))
     assert np.allclose(means, np.zeros(2))
+
+
+def test_CPTP_on_all_modes():
+    "tests that a channel on all the modes gives the same result in any mode order"
+    rng = np.random.default_rng(42)
+    cov = np.eye(4) + 0.1 * np.ones((4, 4))
+    means = rng.normal(size=4)
+    X = rng.normal(size=(4, 4))
+    Y = 0.1 * np.eye(4)
+    d = rng.normal(size=4)
+    cov1, means1 = gp.CPTP(
+        cov=cov, means=means, X=X, Y=Y, d=d, state_modes=[0, 1], transf_modes=[0, 1]
+    )
+    assert np.allclose(cov1, X @ cov @ X.T + Y)
+    assert np.allclose(means1, X @ means + d)
+
+    # same channel with the modes of the state listed in reverse order
+    perm = [1, 0, 3, 2]
+    cov2, means2 = gp.CPTP(
+        cov=cov[perm][:, perm],
+        means=means[perm],
+        X=X,
+        Y=Y,
+        d=d,
+        state_modes=[1, 0],
+        transf_modes=[0, 1],
+    )
+    assert np.allclose(np.array(cov2)[perm][:, perm], cov1)
+    assert np.allclose(np.array(means2)[perm], means1)
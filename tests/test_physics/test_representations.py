@@ -294,6 +294,16 @@ class TestFockRepresentation:
             math.reshape(np.einsum("bcde, pfgeh -> bpcdfgh", self.array2578, array2), -1),
         )
 
+    def test_matmul_fock_fock_no_contraction(self):
+        fock1 = Fock(self.array2578, batched=True)
+        fock2 = Fock(self.array1578, batched=True)
+        fock_test = fock1[()] @ fock2[()]
+        assert fock_test.array.shape == (2, 5, 7, 8, 5, 7, 8)
+        assert np.allclose(
+            fock_test.array,
+            np.einsum("bcde, pfgh -> bpcdefgh", self.array2578, self.array1578)[:, 0],
+        )
+
     @pytest.mark.parametrize("n1", [1, 2])
     @pytest.mark.parametrize("n2", [1, 2])
     def test_matmul_fock_barg(self, n1, n2):
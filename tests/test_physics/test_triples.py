@@ -51,6 +51,13 @@ class TestTriples:
         assert math.allclose(b, np.zeros(n_modes))
         assert math.allclose(c, 1.0)
 
+    def test_vacuum_state_Abc_is_shared(self):
+        A1, b1, _ = triples.vacuum_state_Abc(3)
+        A2, b2, _ = triples.vacuum_state_Abc(3)
+
+        assert A1 is A2
+        assert b1 is b2
+
     def test_coherent_state_Abc(self):
         A1, b1, c1 = triples.coherent_state_Abc(0.1, 0.2)
         assert math.allclose(A1, np.zeros((1, 1)))
@@ -233,6 +240,8 @@ class TestTriples:
         assert math.allclose(b2, [0, 0, 0, 0])
         assert math.allclose(c2, 1)
 
+        assert triples.identity_Abc(2)[0] is A2
+
     def test_attenuator_Abc(self):
         A1, b1, c1 = triples.attenuator_Abc(0.1)
         e = 0.31622777
@@ -32,6 +32,7 @@ class TestSettings:
 
         assert settings.HBAR == 2.0
         assert settings.DEBUG is False
+        assert settings.REPR_SHOW_WIGNER is True
         assert settings.AUTOCUTOFF_PROBABILITY == 0.999  # capture at least 99.9% of the probability
         assert settings.AUTOCUTOFF_MAX_CUTOFF == 100
         assert settings.AUTOCUTOFF_MIN_CUTOFF == 1